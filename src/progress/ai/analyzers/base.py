@@ -31,6 +31,11 @@ class Analyzer(ABC):
     def provider(self) -> str:
         return self._config.provider
 
+    @property
+    def cache_params(self) -> dict[str, str | int]:
+        """Settings that change this analyzer's output for the same input."""
+        return {"provider": self.provider}
+
     @staticmethod
     def apply_parser(parser: ParserType[R], result: str) -> R:
         if is_parseable(parser):
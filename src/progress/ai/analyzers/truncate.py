@@ -14,6 +14,11 @@ class TruncateAnalyzer(Analyzer):
         super().__init__(config)
         self._max_chars: int = config.truncate_chars
 
+    @property
+    @override
+    def cache_params(self) -> dict[str, str | int]:
+        return {**super().cache_params, "truncate_chars": self._max_chars}
+
     @override
     def analyze(
         self,
@@ -0,0 +1,37 @@
+"""Conditional GET support for responses derived from stored reports."""
+
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# Report-derived responses may change whenever a report is added or published,
+# so clients keep them but revalidate with the ETag before each reuse.
+REVALIDATE = "no-cache"
+# The timezone list only changes with a tzdata upgrade.
+STATIC_MAX_AGE = "public, max-age=86400"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag over everything the response body depends on."""
+    digest = hashlib.sha256("\0".join(str(part) for part in parts).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a W/ prefix still matches.
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": cache_control}
+    )
@@ -1,15 +1,25 @@
-from markdown_it import MarkdownIt
-from mdit_py_plugins.footnote import footnote_plugin
-from mdit_py_plugins.front_matter import front_matter_plugin
+import logging
 
-mdit = (
-    MarkdownIt("commonmark", {"breaks": True, "html": True})
-    .use(front_matter_plugin)
-    .use(footnote_plugin)
-)
+from ..db.models import Report
+from ..utils.markdown import mdit, render_markdown
 
+__all__ = ["mdit", "render_markdown", "report_html"]
 
-def render_markdown(content: str | None) -> str:
-    if not content:
-        return ""
-    return mdit.render(content)
+logger = logging.getLogger(__name__)
+
+
+def report_html(report: Report) -> str:
+    """Return a report's rendered HTML, rendering and storing it if missing.
+
+    Reports store their HTML when written; rows saved before the
+    ``content_html`` column existed are rendered on first view and written
+    back, so each is parsed only once.
+    """
+    if report.content_html is not None:
+        return report.content_html
+
+    html = render_markdown(report.content)
+    Report.update(content_html=html).where(Report.id == report.id).execute()
+    report.content_html = html
+    logger.debug(f"Backfilled rendered HTML for report {report.id}")
+    return html
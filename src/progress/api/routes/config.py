@@ -5,11 +5,12 @@ source of truth and these endpoints read/write it. Writes are guarded by
 optimistic locking (``version``) and secrets are masked in every GET response.
 """
 
-import pytz
-from fastapi import APIRouter, HTTPException, Request
+import json
+
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 
-from ...config import OwnerConfig, RepositoryConfig
+from ...config import OwnerConfig, RepositoryConfig, timezone_names
 from ...config_store import (
     ConfigVersionConflict,
     get_config_json_schema,
@@ -23,9 +24,18 @@ from ...contrib.repo.owner import replace_owners
 from ...contrib.repo.repository import replace_repositories
 from ...db.models import Repository
 from ...errors import ConfigException
+from ..caching import STATIC_MAX_AGE, is_not_modified, make_etag, not_modified_response
 
 router = APIRouter(prefix="/config", tags=["config"])
 
+# The timezone list is fixed for the life of the process, so sort and
+# serialize it once rather than on every request.
+_TIMEZONES_SORTED = tuple(sorted(timezone_names()))
+_TIMEZONES_JSON = json.dumps({"timezones": _TIMEZONES_SORTED}).encode()
+_TIMEZONES_ETAG = make_etag(_TIMEZONES_JSON.decode())
+# Likewise the editable-config schema only changes with the code.
+_SCHEMA_JSON = json.dumps(get_config_json_schema()).encode()
+
 
 class ConfigResponse(BaseModel):
     data: dict
@@ -84,12 +94,18 @@ def validate_config(request: ConfigValidateRequest):
 
 @router.get("/schema")
 def get_schema():
-    return get_config_json_schema()
+    return Response(content=_SCHEMA_JSON, media_type="application/json")
 
 
 @router.get("/timezones", response_model=TimezonesResponse)
-def get_timezones():
-    return TimezonesResponse(timezones=sorted(pytz.all_timezones))
+def get_timezones(request: Request):
+    if is_not_modified(request, _TIMEZONES_ETAG):
+        return not_modified_response(_TIMEZONES_ETAG, STATIC_MAX_AGE)
+    return Response(
+        content=_TIMEZONES_JSON,
+        media_type="application/json",
+        headers={"ETag": _TIMEZONES_ETAG, "Cache-Control": STATIC_MAX_AGE},
+    )
 
 
 # --- table-backed lists (repos / owners) ----------------------------------
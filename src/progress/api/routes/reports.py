@@ -1,16 +1,24 @@
+import base64
+import binascii
+import json
+import time
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
-import pytz
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 
+from ...consts import REPORT_COUNT_CACHE_TTL
 from ...db.models import Report
-from ..markdown import render_markdown
+from ..caching import REVALIDATE, is_not_modified, make_etag, not_modified_response
+from ..markdown import report_html
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 PAGE_SIZE = 10
 
+_report_count_cache = {"value": None, "ts": 0.0}
+
 
 class ReportResponse(BaseModel):
     id: int
@@ -34,41 +42,96 @@ class PaginatedReportsResponse(BaseModel):
     total: int
     has_prev: bool
     has_next: bool
+    next_cursor: str | None = None
 
 
 def format_datetime(dt, timezone) -> str:
     if dt is None:
         return ""
-    if isinstance(dt, datetime):
-        return dt.astimezone(timezone).strftime("%Y-%m-%d %H:%M:%S")
     if isinstance(dt, str):
         try:
-            parsed = datetime.fromisoformat(dt)
-            return parsed.astimezone(timezone).strftime("%Y-%m-%d %H:%M:%S")
+            dt = datetime.fromisoformat(dt)
         except ValueError:
             return dt
+    if isinstance(dt, datetime):
+        # Equivalent to strftime("%Y-%m-%d %H:%M:%S") without going through the
+        # locale-aware C formatter once per listed report.
+        dt = dt.astimezone(timezone)
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
     return str(dt)
 
 
-@router.get("", response_model=PaginatedReportsResponse)
-def list_reports(page: int = 1, timezone_str: str = "UTC"):
-    timezone = pytz.timezone(timezone_str)
+def report_count() -> int:
+    """Number of listed reports, reused for up to REPORT_COUNT_CACHE_TTL seconds."""
+    now = time.monotonic()
+    if _report_count_cache["value"] is None or now - _report_count_cache["ts"] >= REPORT_COUNT_CACHE_TTL:
+        _report_count_cache["value"] = Report.select().where(Report.repo.is_null()).count()
+        _report_count_cache["ts"] = now
+    return _report_count_cache["value"]
+
+
+def encode_cursor(row: dict) -> str:
+    """Opaque token for the position just after ``row``."""
+    payload = json.dumps([str(row["created_at"]), row["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
 
-    if page < 1:
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, report_id = json.loads(raw)
+        # Round-trip through datetime so only well-formed timestamps reach the
+        # query; str() gives back the form the column is stored in.
+        created_at = str(datetime.fromisoformat(created_at))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+    if not isinstance(report_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, report_id
+
+
+@router.get("", response_model=PaginatedReportsResponse)
+def list_reports(page: int | None = None, timezone_str: str = "UTC", cursor: str | None = None):
+    timezone = ZoneInfo(timezone_str)
+
+    # A cursor already fixes the position, so an offset page alongside it
+    # would be ambiguous.
+    if cursor is not None and page is not None:
+        raise HTTPException(status_code=400, detail="Use either page or cursor, not both")
+    if page is None or page < 1:
         page = 1
 
-    query = Report.select().where(Report.repo.is_null()).order_by(Report.created_at.desc())
-    total = query.count()
-    reports = list(query.paginate(page, PAGE_SIZE))
+    # Only the listed columns: the content/content_html TEXT columns are never
+    # shown here, and plain dicts skip building a model instance per row.
+    query = Report.select(Report.id, Report.title, Report.created_at, Report.markpost_url).where(
+        Report.repo.is_null()
+    )
+    total = report_count()
+    query = query.order_by(Report.created_at.desc(), Report.id.desc())
+
+    if cursor is not None:
+        # Keyset pagination: seek past the last row the client saw instead of
+        # making the database skip over every earlier page with OFFSET.
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.where(
+            (Report.created_at < cursor_ts) | ((Report.created_at == cursor_ts) & (Report.id < cursor_id))
+        )
+    else:
+        query = query.offset((page - 1) * PAGE_SIZE)
+    # One row past the page says whether another follows; the cached count
+    # may lag behind reports written in the last few seconds.
+    reports = list(query.limit(PAGE_SIZE + 1).dicts())
+    has_more = len(reports) > PAGE_SIZE
+    reports = reports[:PAGE_SIZE]
 
     report_list = [
         ReportResponse(
-            id=report.id,
-            title=report.title,
-            created_at=format_datetime(report.created_at, timezone),
-            markpost_url=report.markpost_url,
+            id=row["id"],
+            title=row["title"],
+            created_at=format_datetime(row["created_at"], timezone),
+            markpost_url=row["markpost_url"],
         )
-        for report in reports
+        for row in reports
     ]
 
     total_pages = (total + PAGE_SIZE - 1) // PAGE_SIZE or 1
@@ -78,23 +141,40 @@ def list_reports(page: int = 1, timezone_str: str = "UTC"):
         page=page,
         total_pages=total_pages,
         total=total,
-        has_prev=page > 1,
-        has_next=page < total_pages,
+        has_prev=cursor is not None or page > 1,
+        has_next=has_more,
+        next_cursor=encode_cursor(reports[-1]) if has_more else None,
     )
 
 
 @router.get("/{report_id}", response_model=ReportDetailResponse)
-def get_report(report_id: int, timezone_str: str = "UTC"):
-    timezone = pytz.timezone(timezone_str)
+def get_report(request: Request, response: Response, report_id: int, timezone_str: str = "UTC"):
+    timezone = ZoneInfo(timezone_str)
 
     report = Report.get_or_none(Report.id == report_id)
     if report is None or report.repo is not None:
         raise HTTPException(status_code=404, detail="Report not found")
 
+    # The ETag covers every field in the body, so an edited title, re-rendered
+    # HTML or a newly published Markpost URL all invalidate cached copies.
+    content = report_html(report)
+    etag = make_etag(
+        report.id,
+        report.title,
+        report.created_at,
+        report.markpost_url,
+        content,
+        timezone_str,
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, REVALIDATE)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE
+
     return ReportDetailResponse(
         id=report.id,
         title=report.title,
         created_at=format_datetime(report.created_at, timezone),
         markpost_url=report.markpost_url,
-        content=render_markdown(report.content or ""),
+        content=content,
     )
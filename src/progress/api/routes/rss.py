@@ -1,53 +1,95 @@
 from datetime import datetime
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+from zoneinfo import ZoneInfo
 
-import pytz
 from fastapi import APIRouter, Request
 from fastapi.responses import Response
-from feedgen.feed import FeedGenerator
 
 from ...db.models import Report
-from ..markdown import render_markdown
+from ..caching import REVALIDATE, is_not_modified, make_etag, not_modified_response
+from ..markdown import report_html
 
 router = APIRouter(tags=["rss"])
 
+RSS_ITEM_LIMIT = 50
+
+RSS_HEADER = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    '<rss xmlns:atom="http://www.w3.org/2005/Atom" '
+    'xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">\n'
+    "  <channel>\n"
+)
+RSS_FOOTER = "  </channel>\n</rss>\n"
+
+
+def parse_created_at(value, timezone) -> datetime | None:
+    # Stored timestamps carry a UTC offset peewee does not parse, so they
+    # usually arrive as ISO strings.
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        return value.astimezone(timezone)
+    return None
+
 
 @router.get("/rss")
 def get_rss(request: Request, timezone_str: str = "UTC", language: str = "en"):
-    timezone = pytz.timezone(timezone_str)
-
-    fg = FeedGenerator()
-    fg.title("Progress Reports")
-    fg.link(href=str(request.base_url))
-    fg.description("Open source project progress reports")
-    fg.language(language)
+    timezone = ZoneInfo(timezone_str)
+    base_url = str(request.base_url)
 
     reports = (
-        Report.select().where(Report.repo.is_null()).order_by(Report.created_at.desc()).limit(50)
+        Report.select(
+            Report.id,
+            Report.title,
+            Report.content,
+            Report.content_html,
+            Report.created_at,
+        )
+        .where(Report.repo.is_null())
+        .order_by(Report.created_at.desc())
+        .limit(RSS_ITEM_LIMIT)
     )
 
+    # The feed is written straight out as text: a feed of full report bodies
+    # would otherwise be built as an lxml tree only to be serialized once.
+    items = []
+    last_build = None
     for report in reports:
-        fe = fg.add_entry()
-        fe.title(report.title or "Untitled Report")
-        fe.link(href=f"{request.base_url}report/{report.id}")
-
-        content = render_markdown(report.content or "")
-        fe.content(content)
-
-        if report.created_at:
-            if isinstance(report.created_at, datetime):
-                created_at = report.created_at.astimezone(timezone)
-            else:
-                created_at = report.created_at
-            fe.published(
-                created_at.strftime("%a, %d %b %Y %H:%M:%S %Z")
-                if isinstance(created_at, datetime)
-                else str(created_at)
-            )
-            fe.updated(
-                created_at.strftime("%a, %d %b %Y %H:%M:%S %Z")
-                if isinstance(created_at, datetime)
-                else str(created_at)
-            )
-
-    rss_feed = fg.rss_str(pretty=True)
-    return Response(content=rss_feed, media_type="application/rss+xml; charset=utf-8")
+        items.append("    <item>\n")
+        items.append(f"      <title>{escape(report.title or 'Untitled Report')}</title>\n")
+        items.append(f"      <link>{escape(f'{base_url}report/{report.id}')}</link>\n")
+        items.append(f"      <description>{escape(report_html(report))}</description>\n")
+        created_at = parse_created_at(report.created_at, timezone)
+        if created_at is not None:
+            items.append(f"      <pubDate>{format_datetime(created_at)}</pubDate>\n")
+            last_build = max(last_build or created_at, created_at)
+        items.append("    </item>\n")
+
+    parts = [
+        RSS_HEADER,
+        "    <title>Progress Reports</title>\n",
+        f"    <link>{escape(base_url)}</link>\n",
+        "    <description>Open source project progress reports</description>\n",
+        "    <docs>http://www.rssboard.org/rss-specification</docs>\n",
+        f"    <language>{escape(language)}</language>\n",
+    ]
+    # Dated by the newest report rather than the clock, so the same reports
+    # always produce the same bytes under the same ETag.
+    if last_build is not None:
+        parts.append(f"    <lastBuildDate>{format_datetime(last_build)}</lastBuildDate>\n")
+    parts.extend(items)
+    parts.append(RSS_FOOTER)
+
+    body = "".join(parts)
+    etag = make_etag(body)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, REVALIDATE)
+    return Response(
+        content=body.encode("utf-8"),
+        media_type="application/rss+xml; charset=utf-8",
+        headers={"ETag": etag, "Cache-Control": REVALIDATE},
+    )
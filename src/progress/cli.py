@@ -317,14 +317,10 @@ def process_reports(
     )
 
     logger.info("Generating full aggregated report for title/summary...")
-    full_sections = [
-        reporter.generate_repository_report(report, timezone)
-        for report in check_result.reports
-    ]
-    for report, section in zip(check_result.reports, full_sections):
-        report.content = section
+    for report in check_result.reports:
+        report.content = reporter.generate_repository_report(report, timezone)
     full_aggregated_report = reporter.render_aggregated_body(
-        full_sections,
+        [report.content for report in check_result.reports],
         check_result.total_commits,
         check_result.repo_statuses,
         timezone,
@@ -476,10 +472,11 @@ def process_reports(
             "This report covered {count} projects with {commits} commits total"
         ).format(count=len(batch.reports), commits=batch_commit_count)
 
+        batch_repo_names = {r.repo_name for r in batch.reports}
         batch_repo_statuses = {
             name: status
             for name, status in check_result.repo_statuses.items()
-            if any(r.repo_name == name for r in batch.reports)
+            if name in batch_repo_names
         }
 
         logger.info(f"Sending notification for batch {batch.batch_index + 1}...")
@@ -822,7 +819,9 @@ def _run_check_command(config: str, trackers_only: bool = False):
             logger.info(f"Starting to check {len(repos)} repositories")
 
             check_result = repo_manager.check_all(
-                repos, concurrency=cfg.analysis.concurrency
+                repos,
+                concurrency=cfg.analysis.concurrency,
+                io_concurrency=cfg.github.io_concurrency,
             )
 
             if check_result.reports:
@@ -3,6 +3,7 @@
 import logging
 import re
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Literal
 from zoneinfo import ZoneInfo, available_timezones
@@ -31,6 +32,16 @@ from .notification.config import NotificationConfig
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def timezone_names() -> frozenset[str]:
+    """IANA timezone names known to zoneinfo.
+
+    available_timezones() walks the whole tzdata directory on each call, and
+    the set cannot change while the process runs, so it is read once.
+    """
+    return frozenset(available_timezones())
+
+
 class MarkpostConfig(BaseModel):
     """Markpost configuration."""
 
@@ -99,6 +110,15 @@ class GitHubConfig(BaseModel):
         ge=1,
         description="Timeout in seconds for GitHub CLI (gh) commands.",
     )
+    io_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description=(
+            "Repositories fetched and diffed at once; analyzer calls stay capped "
+            "by analysis.concurrency."
+        ),
+    )
 
 
 class AnalysisConfig(BaseModel):
@@ -142,6 +162,27 @@ class AnalysisConfig(BaseModel):
         ge=1,
         description="Commits analyzed on the first run of a repository.",
     )
+    requests_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Max analyzer calls per minute across all workers; 0 disables.",
+    )
+    tokens_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Max estimated input tokens (about 4 characters each) sent to the "
+            "analyzer per minute across all workers; 0 disables."
+        ),
+    )
+    cache_policy: Literal["enabled", "read_only", "disabled"] = Field(
+        default="enabled",
+        description=(
+            "Reuse stored analyses of identical diffs: 'enabled' reads and writes "
+            "the cache, 'read_only' only reads it, 'disabled' always calls the "
+            "analyzer."
+        ),
+    )
 
 
 class RepositoryConfig(BaseModel):
@@ -342,7 +383,7 @@ class Config(BaseSettings):
     @field_validator("timezone", mode="before")
     @classmethod
     def validate_timezone(cls, v: str) -> str:
-        if v not in available_timezones():
+        if v not in timezone_names():
             raise ValueError(
                 f"Invalid timezone configuration: '{v}'. "
                 "Please use a valid IANA timezone identifier"
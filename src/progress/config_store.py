@@ -14,6 +14,7 @@ import json
 import logging
 from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -49,6 +50,16 @@ def get_config_json_schema() -> dict:
     Infra fields (data_dir/workspace_dir/observability) and table-backed lists
     (repos/owners) are excluded: they are not stored in or edited through the blob.
     """
+    return deepcopy(_config_json_schema())
+
+
+@lru_cache(maxsize=1)
+def _config_json_schema() -> dict:
+    """Build the editable-config schema once; the Config model never changes at runtime.
+
+    Shared by the secret masking/merging walks, which only read it. Callers
+    that hand the schema out get a copy from :func:`get_config_json_schema`.
+    """
     schema = deepcopy(Config.model_json_schema())
     props = schema.setdefault("properties", {})
     for field in EXCLUDED_FROM_BLOB:
@@ -60,25 +71,31 @@ def get_config_json_schema() -> dict:
     return schema
 
 
-def _config_from_dict(data: dict) -> Config:
-    """Validate ``data`` and build a Config from the dict alone (no env/file)."""
+class _DictConfig(Config):
+    """Config built from init kwargs only, ignoring env vars and the TOML file.
 
-    class _DictConfig(Config):
-        model_config = SettingsConfigDict(
-            env_prefix="PROGRESS_", env_nested_delimiter="__", extra="ignore"
-        )
+    Defined once at import: creating the subclass makes pydantic rebuild the
+    whole Config validator, which would otherwise happen on every validate/save.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="PROGRESS_", env_nested_delimiter="__", extra="ignore"
+    )
 
-        @classmethod
-        def settings_customise_sources(
-            cls,
-            settings_cls: type[BaseSettings],
-            init_settings: PydanticBaseSettingsSource,
-            env_settings: PydanticBaseSettingsSource,
-            dotenv_settings: PydanticBaseSettingsSource,
-            file_secret_settings: PydanticBaseSettingsSource,
-        ) -> tuple[PydanticBaseSettingsSource, ...]:
-            return (init_settings,)
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (init_settings,)
 
+
+def _config_from_dict(data: dict) -> Config:
+    """Validate ``data`` and build a Config from the dict alone (no env/file)."""
     return _DictConfig(**data)
 
 
@@ -265,7 +282,7 @@ def _mask_secrets(value: Any, schema: dict, root: dict) -> Any:
 
 def mask_secrets(data: dict) -> dict:
     """Return a copy of ``data`` with every secret field replaced by the mask."""
-    schema = get_config_json_schema()
+    schema = _config_json_schema()
     return _mask_secrets(data, schema, schema)
 
 
@@ -277,7 +294,7 @@ def _merge_secret_placeholders(submitted: dict, stored: dict) -> dict:
     value is kept so unchanged secrets survive a round-trip through the masked
     GET without forcing the user to re-enter them.
     """
-    schema = get_config_json_schema()
+    schema = _config_json_schema()
 
     def merge(sub: Any, sto: Any, node_schema: dict) -> Any:
         node_schema = _resolve_ref(node_schema, schema)
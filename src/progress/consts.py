@@ -1,5 +1,7 @@
 """Constants for Progress application"""
 
+from functools import lru_cache
+
 # ==================== File Paths ====================
 DATABASE_PATH = "data/progress.db"
 WORKSPACE_DIR_DEFAULT = "data/repos"
@@ -29,6 +31,48 @@ GIT_RETRY_DELAY = 5  # seconds
 GH_MAX_RETRIES = 3
 GH_RETRY_DELAY = 5  # seconds
 
+# ==================== Clone Options ====================
+# Blobless partial clone: full commit history is kept (commit ranges, counts and
+# release diffs still resolve) while file contents are fetched on demand.
+GIT_CLONE_FILTER = "blob:none"
+
+# ==================== Diff Spooling ====================
+# Patch bytes kept in memory while assembling a diff; larger diffs spill to a
+# temporary file instead of holding a second full copy in RAM.
+DIFF_SPOOL_MAX_SIZE = 10 * 1024 * 1024  # 10MB
+
+# ==================== Large Diffs ====================
+# Changed lines (insertions + deletions) above which a diff is assembled per
+# file with each file's patch capped, instead of loading the whole patch.
+LARGE_DIFF_LINE_THRESHOLD = 5000
+LARGE_DIFF_FILE_MAX_LINES = 200
+
+# ==================== SSH Multiplexing ====================
+# Idle time an SSH master connection is kept open for reuse by later clones
+# and fetches; the master exits on its own once this elapses.
+SSH_CONTROL_PERSIST = "60s"
+
+# ==================== GitHub API Cache ====================
+# Seconds a fetched GitHub repository object is reused by GitHubClient, so the
+# release listing, tag and notes lookups of one check share a single fetch.
+GITHUB_REPO_CACHE_TTL = 300
+
+# ==================== Analysis Cache ====================
+# Days a stored diff analysis is reused; older rows are ignored on lookup and
+# deleted whenever a new analysis is stored.
+ANALYSIS_CACHE_MAX_AGE_DAYS = 30
+
+# ==================== Reports ====================
+# Commit messages up to this length are interned when kept on a report, so
+# subjects repeated across repositories (merges, reverts, bumps) share storage.
+COMMIT_MESSAGE_INTERN_MAX_LENGTH = 256
+
+# ==================== Web ====================
+# Seconds the report list reuses its row count instead of running COUNT(*) on
+# every request; reports are written by the CLI process, so this is the bound
+# on how stale total/total_pages can be.
+REPORT_COUNT_CACHE_TTL = 5.0
+
 # ==================== Template Names ====================
 TEMPLATE_ANALYSIS_PROMPT = "analysis_prompt.j2"
 TEMPLATE_README_ANALYSIS_PROMPT = "readme_analysis_prompt.j2"
@@ -52,6 +96,9 @@ DB_JOURNAL_MODE = "wal"
 DB_SYNCHRONOUS = "NORMAL"
 DB_BUSY_TIMEOUT = 5000  # 5 seconds
 DB_CACHE_SIZE = -64 * 1000  # 64MB
+DB_TEMP_STORE = "memory"  # temp tables and indices for sorts stay in RAM
+DB_MMAP_SIZE = 256 * 1024 * 1024  # 256MB of the file read via mmap
+DB_BATCH_SIZE = 100  # rows per multi-row INSERT (keeps under SQLite's variable limit)
 
 # ==================== Database Pragmas ====================
 DB_PRAGMAS = {
@@ -60,9 +107,12 @@ DB_PRAGMAS = {
     "busy_timeout": DB_BUSY_TIMEOUT,
     "foreign_keys": 1,
     "cache_size": DB_CACHE_SIZE,
+    "temp_store": DB_TEMP_STORE,
+    "mmap_size": DB_MMAP_SIZE,
 }
 
 
+@lru_cache(maxsize=4096)
 def parse_repo_name(url: str) -> str:
     """Extract repository slug (owner/repo) from URL.
 
@@ -1,17 +1,28 @@
+import hashlib
 import json
 import logging
 import re
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import json_repair
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from peewee import DatabaseError
 
 from progress.ai import Analyzer
-from progress.consts import TEMPLATE_ANALYSIS_PROMPT, TEMPLATE_README_ANALYSIS_PROMPT
+from progress.consts import (
+    ANALYSIS_CACHE_MAX_AGE_DAYS,
+    TEMPLATE_ANALYSIS_PROMPT,
+    TEMPLATE_README_ANALYSIS_PROMPT,
+)
 from progress.errors import AnalysisException
 from progress.i18n import gettext as _
 from progress.telemetry import record_analysis_failure, report_error
 
+from .models import AnalysisCache
+
 logger = logging.getLogger(__name__)
 
 _template_dir = Path(__file__).parent.parent.parent / "templates"
@@ -52,6 +63,44 @@ def _extract_json(output: str) -> str:
     raise AnalysisException("Could not extract JSON from Claude output")
 
 
+def _analysis_cache_key(params: dict[str, str | int], prompt: str, diff: str) -> str:
+    digest = hashlib.sha256()
+    for part in (json.dumps(params, sort_keys=True), prompt, diff):
+        digest.update(part.encode("utf-8", errors="replace"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _analysis_cache_cutoff() -> datetime:
+    return datetime.now(UTC) - timedelta(days=ANALYSIS_CACHE_MAX_AGE_DAYS)
+
+
+def _load_cached_analysis(key: str) -> tuple[str, str] | None:
+    try:
+        entry = AnalysisCache.get_or_none(
+            (AnalysisCache.key == key)
+            & (AnalysisCache.created_at >= _analysis_cache_cutoff())
+        )
+    except DatabaseError as e:
+        logger.warning("Failed to read analysis cache: %s", e)
+        return None
+    if entry is None:
+        return None
+    return entry.summary, entry.detail
+
+
+def _store_cached_analysis(key: str, summary: str, detail: str) -> None:
+    try:
+        AnalysisCache.insert(
+            key=key, summary=summary, detail=detail
+        ).on_conflict_replace().execute()
+        AnalysisCache.delete().where(
+            AnalysisCache.created_at < _analysis_cache_cutoff()
+        ).execute()
+    except DatabaseError as e:
+        logger.warning("Failed to write analysis cache: %s", e)
+
+
 def analyze_diff(
     analyzer: Analyzer,
     repo_name: str,
@@ -60,6 +109,8 @@ def analyze_diff(
     commit_messages: list[str],
     max_diff_length: int,
     language: str,
+    cache_policy: str = "enabled",
+    analysis_slot: Callable[[int], AbstractContextManager] | None = None,
 ) -> tuple[str, str, bool, int, int]:
     original_length = len(diff)
     truncated = False
@@ -85,11 +136,25 @@ def analyze_diff(
         analyzed_diff_length=len(diff),
     )
 
+    cache_key = None
+    if cache_policy != "disabled":
+        cache_key = _analysis_cache_key(analyzer.cache_params, prompt, diff)
+        cached = _load_cached_analysis(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached analysis for %s", repo_name)
+            return *cached, truncated, original_length, len(diff)
+
+    # Concurrency and rate-limit budget are only spent on an actual analyzer
+    # call, so cached results never wait behind the limits.
+    slot = analysis_slot(len(diff)) if analysis_slot is not None else nullcontext()
     logger.info("Analyzing code changes for %s...", repo_name)
     try:
-        summary, detail = analyzer.analyze(
-            content=diff, prompt=prompt, parser=AnalysisResultParser()
-        )
+        with slot:
+            summary, detail = analyzer.analyze(
+                content=diff, prompt=prompt, parser=AnalysisResultParser()
+            )
+        if cache_key and cache_policy == "enabled":
+            _store_cached_analysis(cache_key, summary, detail)
     except Exception as e:
         logger.warning("Code analysis failed: %s", e)
         provider = getattr(analyzer, "provider", "unknown")
@@ -5,6 +5,7 @@ from peewee import (
     BooleanField,
     CharField,
     DateTimeField,
+    TextField,
 )
 
 from progress.db.models import BaseModel
@@ -29,3 +30,15 @@ class GitHubOwner(BaseModel):
         if self._pk is not None:
             self.updated_at = datetime.now(UTC)
         return super().save(*args, **kwargs)
+
+
+class AnalysisCache(BaseModel):
+    """Stored diff analysis, keyed by a hash of everything sent to the analyzer."""
+
+    key = CharField(unique=True)
+    summary = TextField()
+    detail = TextField()
+    created_at = DateTimeField(default=lambda: datetime.now(UTC))
+
+    class Meta:
+        table_name = "analysis_cache"
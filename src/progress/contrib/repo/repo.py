@@ -3,15 +3,29 @@
 import logging
 import os
 import shutil
+import sys
+import tempfile
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
+from git import GitError
+
 from ...config import Config
-from ...consts import CMD_GH, GH_MAX_RETRIES
+from ...consts import (
+    CMD_GH,
+    GH_MAX_RETRIES,
+    GIT_CLONE_FILTER,
+    LARGE_DIFF_FILE_MAX_LINES,
+    LARGE_DIFF_LINE_THRESHOLD,
+    SSH_CONTROL_PERSIST,
+    parse_repo_name,
+)
 from ...db import UTC
 from ...db.models import Repository
 from ...enums import Protocol
-from ...errors import GitException
+from ...errors import CommandException, GitException
 from ...git import (
     GitClient,
     GitHubClient,
@@ -23,6 +37,38 @@ from ...utils import get_now, retry, run_command, sanitize
 
 logger = logging.getLogger(__name__)
 
+# SSH client availability does not change while the process runs.
+_SSH_AVAILABLE = shutil.which("ssh") is not None
+
+
+@lru_cache
+def _resolve_executable(name: str) -> str:
+    """Absolute path of ``name`` on PATH, or ``name`` itself if not found.
+
+    CPython < 3.13 only spawns through ``posix_spawn`` when the executable has
+    a directory part, so bare names like ``gh`` always fork+exec.
+    """
+    return shutil.which(name) or name
+
+
+def _ssh_multiplex_env() -> Dict[str, str]:
+    """Build git environment that shares one SSH connection per host.
+
+    Returns:
+        Environment additions with ``GIT_SSH_COMMAND``, or an empty dict when
+        the user already configured their own SSH command
+    """
+    if "GIT_SSH_COMMAND" in os.environ:
+        return {}
+    control_path = Path(tempfile.gettempdir()) / f"progress-ssh-{os.getuid()}-%C"
+    return {
+        "GIT_SSH_COMMAND": (
+            "ssh -o ControlMaster=auto "
+            f"-o ControlPath={control_path} "
+            f"-o ControlPersist={SSH_CONTROL_PERSIST}"
+        )
+    }
+
 
 class Repo:
     """Repository wrapper encapsulating model and git operations.
@@ -62,12 +108,16 @@ class Repo:
         self.config = config
         self.gh_token = gh_token
         self.proxy = proxy
+        self._gh_env: Dict[str, str] | None = None
+        # Set once clone_or_update has brought the clone up to date, so the
+        # diff does not repeat the remote round trip the check already made.
+        self._synced = False
 
         if isinstance(protocol, str):
             protocol = Protocol(protocol)
         self.protocol = protocol
 
-        self.ssh_available = shutil.which("ssh") is not None
+        self.ssh_available = _SSH_AVAILABLE
         if self.protocol == Protocol.SSH and not self.ssh_available:
             logger.warning(
                 "SSH protocol configured but SSH client not available, "
@@ -79,14 +129,12 @@ class Repo:
         else:
             self.github_client = github_client
 
-    @property
+    @cached_property
     def slug(self) -> str:
         """Get repository slug (owner/repo)."""
-        from ...consts import parse_repo_name
-
         return parse_repo_name(self.model.url)
 
-    @property
+    @cached_property
     def link(self) -> str:
         """Get full GitHub web URL."""
         return f"https://github.com/{self.slug}"
@@ -96,7 +144,7 @@ class Repo:
         """Check if repository is being analyzed for the first time."""
         return not self.model.last_commit_hash
 
-    @property
+    @cached_property
     def repo_path(self) -> Path:
         """Get local repository path."""
         repo_name = sanitize_repo_name(self.slug)
@@ -144,11 +192,43 @@ class Repo:
             full_url, short_url = resolve_repo_url(self.model.url, effective_protocol)
             logger.info(f"Using URL: {full_url} (protocol: {effective_protocol})")
             self._run_gh_clone_command(full_url, self.model.branch)
+        elif self._remote_head_unchanged():
+            logger.debug(f"Remote {self.model.branch} unchanged, skipping fetch")
+        elif self._get_effective_protocol(self.model.url) == Protocol.SSH:
+            self.git.fetch_and_reset(
+                self.repo_path,
+                self.model.branch,
+                env=_ssh_multiplex_env(),
+                working_tree=False,
+            )
         else:
-            self.git.fetch_and_reset(self.repo_path, self.model.branch)
+            self.git.fetch_and_reset(
+                self.repo_path, self.model.branch, working_tree=False
+            )
 
+        self._synced = True
         return self.repo_path
 
+    def _remote_head_unchanged(self) -> bool:
+        """Check whether the local HEAD already matches the remote branch tip.
+
+        Returns:
+            True if fetching would bring in nothing new, False otherwise
+            (including when the comparison itself fails)
+        """
+        try:
+            remote_head = self.git.get_remote_head(self.repo_path, self.model.branch)
+            return remote_head is not None and remote_head == self.get_current_commit()
+        # ls-remote failures surface as CommandException; reading HEAD through
+        # GitPython raises GitError, or ValueError while HEAD is unborn.
+        except (CommandException, GitException, GitError, ValueError) as e:
+            logger.debug(f"Could not compare remote head for {self.slug}: {e}")
+            return False
+
+    def close(self) -> None:
+        """Release git resources held for this repository."""
+        self.git.close_repo(self.repo_path)
+
     def get_current_commit(self) -> str:
         """Get current HEAD commit hash.
 
@@ -167,7 +247,8 @@ class Repo:
         Raises:
             GitException: If git operations fail
         """
-        self.clone_or_update()
+        if not self._synced:
+            self.clone_or_update()
         current_commit = self.get_current_commit()
 
         if self.model.last_commit_hash == current_commit:
@@ -227,10 +308,10 @@ class Repo:
         commit_messages = self.git.get_commit_messages(
             self.repo_path, previous_commit, current_commit
         )
-        commit_count = self.git.get_commit_count(
-            self.repo_path, previous_commit, current_commit
-        )
-        diff = self.git.get_commit_diff(self.repo_path, previous_commit, current_commit)
+        # Messages are listed over the same range, so their count is the
+        # commit count; no second walk of the history is needed.
+        commit_count = len(commit_messages)
+        diff = self._get_commit_diff(previous_commit, current_commit)
 
         return diff, previous_commit, commit_count, commit_messages, True
 
@@ -273,12 +354,42 @@ class Repo:
         commit_messages = self.git.get_commit_messages(
             self.repo_path, previous_commit, current_commit
         )
-        commit_count = self.git.get_commit_count(
+        # Messages are listed over the same range, so their count is the
+        # commit count; no second walk of the history is needed.
+        commit_count = len(commit_messages)
+        diff = self._get_commit_diff(previous_commit, current_commit)
+
+        return diff, previous_commit, commit_count, commit_messages, True
+
+    def _get_commit_diff(self, previous_commit: str, current_commit: str) -> str:
+        """Get the diff to analyze between two commits.
+
+        The size of the change is checked with ``git diff --shortstat`` first;
+        past LARGE_DIFF_LINE_THRESHOLD changed lines each file's patch is capped
+        so the analyzer sees every file instead of the first few in full.
+
+        Args:
+            previous_commit: Last analyzed commit
+            current_commit: Current HEAD commit
+
+        Returns:
+            Diff content
+        """
+        files, insertions, deletions = self.git.get_diff_shortstat(
             self.repo_path, previous_commit, current_commit
         )
-        diff = self.git.get_commit_diff(self.repo_path, previous_commit, current_commit)
+        if insertions + deletions <= LARGE_DIFF_LINE_THRESHOLD:
+            return self.git.get_commit_diff(
+                self.repo_path, previous_commit, current_commit
+            )
 
-        return diff, previous_commit, commit_count, commit_messages, True
+        logger.info(
+            f"Large diff for {self.slug} ({files} files, +{insertions}/-{deletions}), "
+            f"capping each file at {LARGE_DIFF_FILE_MAX_LINES} lines"
+        )
+        return self.git.get_capped_commit_diff(
+            self.repo_path, previous_commit, current_commit, LARGE_DIFF_FILE_MAX_LINES
+        )
 
     def update(self, current_commit: str) -> None:
         """Update repository model state after analysis.
@@ -286,12 +397,17 @@ class Repo:
         Args:
             current_commit: Current HEAD commit hash
         """
-        from ...db import database
-
-        with database.atomic():
-            self.model.last_commit_hash = current_commit
-            self.model.last_check_time = get_now(UTC)
-            self.model.save()
+        # A single UPDATE of the changed columns; the in-memory model is kept
+        # in sync instead of re-saving every field through Model.save().
+        now = get_now(UTC)
+        Repository.update(
+            last_commit_hash=current_commit,
+            last_check_time=now,
+            updated_at=now,
+        ).where(Repository.id == self.model.id).execute()
+        self.model.last_commit_hash = current_commit
+        self.model.last_check_time = now
+        self.model.updated_at = now
 
     def update_releases(self, release_tag: str, commit_hash: str) -> None:
         """Update repository release tracking state after analysis.
@@ -300,13 +416,17 @@ class Repo:
             release_tag: Release tag name (e.g., "v5.0.0")
             commit_hash: Commit hash the release tag points to
         """
-        from ...db import database
-
-        with database.atomic():
-            self.model.last_release_tag = release_tag
-            self.model.last_release_commit_hash = commit_hash
-            self.model.last_release_check_time = get_now(UTC)
-            self.model.save()
+        now = get_now(UTC)
+        Repository.update(
+            last_release_tag=release_tag,
+            last_release_commit_hash=commit_hash,
+            last_release_check_time=now,
+            updated_at=now,
+        ).where(Repository.id == self.model.id).execute()
+        self.model.last_release_tag = release_tag
+        self.model.last_release_commit_hash = commit_hash
+        self.model.last_release_check_time = now
+        self.model.updated_at = now
 
     def check_releases(self) -> Optional[dict]:
         """Check for new GitHub releases.
@@ -329,8 +449,6 @@ class Repo:
 
         last_check_time = self.model.last_release_check_time
 
-        from datetime import datetime, timezone
-
         if isinstance(last_check_time, str):
             try:
                 last_check_time = datetime.fromisoformat(last_check_time)
@@ -432,6 +550,7 @@ class Repo:
         """
         repo_path = self.repo_path
 
+        self.git.close_repo(repo_path)
         if repo_path.exists():
             logger.debug(f"Removing existing repository path: {repo_path}")
             shutil.rmtree(repo_path)
@@ -447,6 +566,10 @@ class Repo:
             branch,
             "--single-branch",
             "--tags",
+            f"--filter={GIT_CLONE_FILTER}",
+            # Checks only read commits and diffs, never files, so skip the
+            # checkout that would fetch every blob of the tip up front.
+            "--no-checkout",
         ]
 
         self._run_command(cmd)
@@ -463,6 +586,11 @@ class Repo:
         if cmd[0] != CMD_GH:
             return None
 
+        # Token, proxy and protocol are fixed for this Repo, so the environment
+        # is built once and reused by every later gh command.
+        if self._gh_env is not None:
+            return self._gh_env
+
         env = os.environ.copy()
         if self.gh_token:
             env["GH_TOKEN"] = self.gh_token
@@ -471,7 +599,10 @@ class Repo:
             env["HTTP_PROXY"] = self.proxy
             env["HTTPS_PROXY"] = self.proxy
             logger.debug(f"Using proxy: {sanitize(self.proxy)}")
+        if self._get_effective_protocol(self.model.url) == Protocol.SSH:
+            env.update(_ssh_multiplex_env())
 
+        self._gh_env = env
         return env
 
     def _run_command(self, cmd: list[str]) -> str:
@@ -489,8 +620,17 @@ class Repo:
             GitException: If command fails
         """
         env = self._prepare_env(cmd)
+        # Descriptors are non-inheritable by default (PEP 446), so keeping
+        # close_fds=False is safe. Together with an absolute executable path it
+        # lets CPython < 3.13 spawn via posix_spawn instead of fork+exec; 3.13
+        # uses posix_spawn with close_fds=True too, so the flag can go then.
+        cmd = [_resolve_executable(cmd[0]), *cmd[1:]]
+        # The child shares our stdout/stderr, so pending output is written first.
+        sys.stdout.flush()
+        sys.stderr.flush()
         return run_command(
             cmd,
             timeout=self.config.github.gh_timeout,
             env=env,
+            close_fds=False,
         )
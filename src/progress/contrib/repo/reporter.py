@@ -46,6 +46,14 @@ class MarkdownReporter:
         self.jinja_env.globals["_"] = _
         self.jinja_env.filters["escape_html"] = _escape_html
 
+        # Compiled once here: the repository template is rendered per report.
+        self._repository_template = self.jinja_env.get_template(
+            TEMPLATE_REPOSITORY_REPORT
+        )
+        self._aggregated_template = self.jinja_env.get_template(
+            TEMPLATE_AGGREGATED_REPORT
+        )
+
     def generate_repository_report(
         self, report, timezone: ZoneInfo = ZoneInfo("UTC")
     ) -> str:
@@ -58,8 +66,7 @@ class MarkdownReporter:
         Returns:
             Rendered Markdown report
         """
-        template = self.jinja_env.get_template(TEMPLATE_REPOSITORY_REPORT)
-        return template.render(
+        return self._repository_template.render(
             report=report,
             timezone=timezone,
         )
@@ -86,14 +93,11 @@ class MarkdownReporter:
         Returns:
             Complete aggregated Markdown report
         """
-        rendered_reports = []
         for report in reports:
-            content = self.generate_repository_report(report, timezone)
-            report.content = content
-            rendered_reports.append(content)
+            report.content = self.generate_repository_report(report, timezone)
 
         return self.render_aggregated_body(
-            rendered_reports,
+            [report.content for report in reports],
             total_commits,
             repo_statuses,
             timezone,
@@ -128,8 +132,7 @@ class MarkdownReporter:
             Complete aggregated Markdown report
         """
         now = datetime.now(timezone)
-        template = self.jinja_env.get_template(TEMPLATE_AGGREGATED_REPORT)
-        return template.render(
+        return self._aggregated_template.render(
             rendered_reports=sections,
             total_commits=total_commits,
             repo_statuses=repo_statuses,
@@ -1,20 +1,32 @@
 """Repository manager - unified management of all repository operations."""
 
+import contextvars
 import logging
+import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 
 from opentelemetry import context as otel_context
+from peewee import EXCLUDED, chunked
 
+from progress import db
 from progress.ai import Analyzer
 from progress.config import Config
-from progress.consts import WORKSPACE_DIR_DEFAULT
+from progress.consts import (
+    COMMIT_MESSAGE_INTERN_MAX_LENGTH,
+    DB_BATCH_SIZE,
+    WORKSPACE_DIR_DEFAULT,
+    parse_repo_name,
+)
+from progress.db import UTC
 from progress.db.models import Repository
 from progress.enums import Protocol
 from progress.git import GitClient, GitHubClient, normalize_repo_url
 from progress.i18n import gettext as _
 from progress.telemetry import get_tracer, record_repo_checked, report_error
+from progress.utils import TokenBucket, get_now
 
 from .analysis import analyze_diff, analyze_releases
 from .repo import Repo
@@ -24,12 +36,40 @@ logger = logging.getLogger(__name__)
 
 
 def _get_database():
-    """Get database instance (lazy import)."""
-    from ... import db
-
+    """Get the database instance ``init_db`` bound on :mod:`progress.db`."""
     return db.database
 
 
+def _freeze_messages(messages: list[str]) -> tuple[str, ...]:
+    """Store commit messages compactly for a report.
+
+    Short messages are interned so identical subjects kept by different
+    reports share one string; longer ones are kept as they are.
+    """
+    return tuple(
+        sys.intern(message)
+        if len(message) <= COMMIT_MESSAGE_INTERN_MAX_LENGTH
+        else message
+        for message in messages
+    )
+
+
+# Columns a repository check reads. Bookkeeping timestamps are left out so
+# list_enabled() does not parse datetimes nobody looks at; rows stay Repository
+# instances because Repo mirrors its single-column UPDATEs onto them.
+_CHECK_FIELDS = (
+    Repository.id,
+    Repository.name,
+    Repository.url,
+    Repository.branch,
+    Repository.enabled,
+    Repository.last_commit_hash,
+    Repository.last_release_tag,
+    Repository.last_release_commit_hash,
+    Repository.last_release_check_time,
+)
+
+
 @dataclass
 class SyncResult:
     """Synchronization result."""
@@ -53,41 +93,41 @@ def replace_repositories(
     table match the desired set. Used by the config UI and ``config import``; the
     tracking check verifies repos lazily and skips ones that no longer exist.
     """
-    from ...consts import parse_repo_name
-
     database = _get_database()
-    configured_urls = set()
-    created_count = 0
-    updated_count = 0
+    desired: dict[str, dict] = {}
+    for repo_config in repos_config:
+        normalized_url = normalize_repo_url(
+            repo_config.url, repo_config.protocol, default_protocol
+        )
+        desired[normalized_url] = {
+            "url": normalized_url,
+            "name": parse_repo_name(repo_config.url),
+            "branch": repo_config.branch,
+            "enabled": repo_config.enabled,
+        }
 
     with database.atomic():
-        for repo_config in repos_config:
-            normalized_url = normalize_repo_url(
-                repo_config.url, repo_config.protocol, default_protocol
-            )
-            name = parse_repo_name(repo_config.url)
-            configured_urls.add(normalized_url)
-
-            repo, created = Repository.get_or_create(
-                url=normalized_url,
-                defaults={
-                    "name": name,
-                    "branch": repo_config.branch,
-                    "enabled": repo_config.enabled,
+        # Only count the desired URLs that already exist; the rest of the table
+        # is pruned below and never needs to be loaded.
+        updated_count = sum(
+            Repository.select().where(Repository.url.in_(batch)).count()
+            for batch in chunked(desired, DB_BATCH_SIZE)
+        )
+        created_count = len(desired) - updated_count
+
+        for batch in chunked(desired.values(), DB_BATCH_SIZE):
+            Repository.insert_many(batch).on_conflict(
+                conflict_target=[Repository.url],
+                update={
+                    Repository.name: EXCLUDED.name,
+                    Repository.branch: EXCLUDED.branch,
+                    Repository.enabled: EXCLUDED.enabled,
+                    Repository.updated_at: EXCLUDED.updated_at,
                 },
-            )
-            if not created:
-                repo.name = name
-                repo.branch = repo_config.branch
-                repo.enabled = repo_config.enabled
-                repo.url = normalized_url
-                repo.save()
-                updated_count += 1
-            else:
-                created_count += 1
+            ).execute()
 
         deleted_count = (
-            Repository.delete().where(Repository.url.not_in(configured_urls)).execute()
+            Repository.delete().where(Repository.url.not_in(list(desired))).execute()
         )
 
     return SyncResult(
@@ -95,7 +135,7 @@ def replace_repositories(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryReport:
     """Repository check report."""
 
@@ -106,17 +146,20 @@ class RepositoryReport:
     commit_count: int
     current_commit: str
     previous_commit: str | None
-    commit_messages: list[str]
+    commit_messages: tuple[str, ...]
     analysis_summary: str
     analysis_detail: str
     truncated: bool
     original_diff_length: int
     analyzed_diff_length: int
     releases: list | None = None
+    # Slotted classes take no ad-hoc attributes, so the rendered section set
+    # through ``content`` needs a declared slot.
+    _content: str | None = field(default=None, init=False, repr=False)
 
     @property
     def content(self) -> str:
-        if hasattr(self, "_content"):
+        if self._content is not None:
             return self._content
         return f"{self.analysis_summary}\n\n{self.analysis_detail}"
 
@@ -125,7 +168,7 @@ class RepositoryReport:
         self._content = value
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckAllResult:
     """Check all repositories result."""
 
@@ -154,6 +197,7 @@ class RepositoryManager:
         self.config = config
         self.language = config.analysis.language
         self.max_diff_length = config.analysis.max_diff_length
+        self.cache_policy = config.analysis.cache_policy
         self.logger = logger
 
         workspace_dir = config.workspace_dir or WORKSPACE_DIR_DEFAULT
@@ -168,15 +212,39 @@ class RepositoryManager:
 
         self.github_client = GitHubClient(token=self.gh_token, proxy=self.proxy)
 
+        # (repository id, commit hash) pairs analysed during check_all; None
+        # outside check_all, where commits are written straight away.
+        self._pending_commits: list[tuple[int, str]] | None = None
+        # Caps analyzer calls across check_all workers; unlimited outside it.
+        self._analysis_slots: threading.BoundedSemaphore | nullcontext = nullcontext()
+        requests_per_minute = config.analysis.requests_per_minute
+        tokens_per_minute = config.analysis.tokens_per_minute
+        self._rate_limiter = (
+            TokenBucket(requests_per_minute, tokens_per_minute)
+            if requests_per_minute or tokens_per_minute
+            else None
+        )
+
+    @contextmanager
+    def _analysis_slot(self, content_length: int):
+        """Hold an analyzer slot once the configured rate limits allow a call.
+
+        Args:
+            content_length: Characters sent to the analyzer, ~4 per token
+        """
+        with self._analysis_slots:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(content_length // 4)
+            yield
+
     def list_enabled(self) -> list[Repository]:
         """Get all enabled repositories.
 
         Returns:
             List of enabled repositories
         """
-        database = _get_database()
-        with database.connection_context():
-            return list(Repository.select().where(Repository.enabled))
+        with db.connection_context():
+            return list(Repository.select(*_CHECK_FIELDS).where(Repository.enabled))
 
     def get_by_name(self, name: str) -> Repository | None:
         """Get repository by name.
@@ -187,9 +255,8 @@ class RepositoryManager:
         Returns:
             Repository object or None
         """
-        database = _get_database()
         try:
-            with database.connection_context():
+            with db.connection_context():
                 return Repository.get(Repository.name == name)
         except Repository.DoesNotExist:
             return None
@@ -258,13 +325,17 @@ class RepositoryManager:
             }
 
             try:
-                summary, detail = analyze_releases(
-                    self.analyzer,
-                    repo_name,
-                    branch,
-                    single_release_data,
-                    self.language,
+                content_length = len(release.get("notes") or "") + len(
+                    diff_content or ""
                 )
+                with self._analysis_slot(content_length):
+                    summary, detail = analyze_releases(
+                        self.analyzer,
+                        repo_name,
+                        branch,
+                        single_release_data,
+                        self.language,
+                    )
             except Exception as e:
                 self.logger.warning(
                     f"Failed to analyze release {release['tag_name']}: {e}"
@@ -338,7 +409,21 @@ class RepositoryManager:
             protocol=self.protocol,
             github_client=self.github_client,
         )
+        try:
+            return self._check_repo(repo, repo_obj)
+        finally:
+            repo_obj.close()
+
+    def _check_repo(self, repo: Repository, repo_obj: Repo) -> RepositoryReport | None:
+        """Run the check for a repository once its Repo wrapper is built.
+
+        Args:
+            repo: Repository object
+            repo_obj: Repo wrapper for the repository
 
+        Returns:
+            RepositoryReport check report, or None if no changes
+        """
         # Clone or update repository
         with get_tracer("progress.repo").start_as_current_span(
             "repo.sync",
@@ -346,16 +431,28 @@ class RepositoryManager:
         ):
             repo_obj.clone_or_update()
 
-        # Check releases (independent from commits)
+        # The release lookup (GitHub API) and the diff (local git) are
+        # independent, so the diff is computed on a helper thread meanwhile.
+        # Release analysis below reads the git repository too, so it only
+        # starts once the diff is done. The diff runs in a copy of this
+        # thread's context so its spans stay under the current trace.
         releases_list = None
-        try:
-            release_data = repo_obj.check_releases()
-        except Exception as e:
-            self.logger.warning(
-                f"Failed to check releases for {repo.name}: {e}",
-                exc_info=True,
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="repo_diff"
+        ) as diff_executor:
+            diff_future = diff_executor.submit(
+                contextvars.copy_context().run, repo_obj.get_diff
             )
-            release_data = None
+            try:
+                release_data = repo_obj.check_releases()
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to check releases for {repo.name}: {e}",
+                    exc_info=True,
+                )
+                release_data = None
+            diff_error = diff_future.exception()
+
         if release_data:
             try:
                 is_first_check = release_data.get("is_first_check", False)
@@ -380,8 +477,11 @@ class RepositoryManager:
                 self.logger.error(f"Failed to analyze releases: {e}")
                 self.logger.info("Continuing with commit analysis...")
 
-        # Get diff data, returns None if no new commits
-        diff_data = repo_obj.get_diff()
+        # Releases are recorded even when the diff failed, as before.
+        if diff_error is not None:
+            raise diff_error
+        # Diff data is None if there are no new commits
+        diff_data = diff_future.result()
         if diff_data is None and not releases_list:
             self.logger.debug("No new commits or releases, skipping")
             return None
@@ -425,9 +525,11 @@ class RepositoryManager:
                         commit_messages,
                         self.max_diff_length,
                         self.language,
+                        self.cache_policy,
+                        analysis_slot=self._analysis_slot,
                     )
                 current_commit = repo_obj.get_current_commit()
-                repo_obj.update(current_commit)
+                self._record_commit(repo_obj, current_commit)
             else:
                 self.logger.warning("Diff is empty, skipping commit analysis")
 
@@ -444,7 +546,7 @@ class RepositoryManager:
             commit_count=commit_count,
             current_commit=current_commit or "",
             previous_commit=previous_commit,
-            commit_messages=commit_messages,
+            commit_messages=_freeze_messages(commit_messages),
             analysis_summary=analysis_summary,
             analysis_detail=analysis_detail,
             truncated=truncated,
@@ -453,21 +555,78 @@ class RepositoryManager:
             releases=releases_list,
         )
 
+    def _record_commit(self, repo_obj: Repo, current_commit: str) -> None:
+        """Record the analysed commit, deferring the write while check_all runs.
+
+        Args:
+            repo_obj: Repo wrapper for the repository
+            current_commit: Current HEAD commit hash
+        """
+        if self._pending_commits is None:
+            repo_obj.update(current_commit)
+        else:
+            self._pending_commits.append((repo_obj.model.id, current_commit))
+
+    def _flush_pending_commits(self) -> None:
+        """Write the commits deferred by check_all in a single transaction."""
+        pending, self._pending_commits = self._pending_commits, None
+        if not pending:
+            return
+        now = get_now(UTC)
+        database = _get_database()
+        with db.connection_context(), database.atomic():
+            for repo_id, commit_hash in pending:
+                Repository.update(
+                    last_commit_hash=commit_hash,
+                    last_check_time=now,
+                    updated_at=now,
+                ).where(Repository.id == repo_id).execute()
+        self.logger.debug(f"Recorded {len(pending)} analysed commit(s)")
+
     def check_all(
-        self, repos: list[Repository] | None = None, concurrency: int = 1
+        self,
+        repos: list[Repository] | None = None,
+        concurrency: int = 1,
+        io_concurrency: int | None = None,
     ) -> CheckAllResult:
         """Check all repositories (supports concurrency, skip on failure).
 
         Args:
             repos: List of repositories, None to get enabled repositories automatically
-            concurrency: Concurrency level (1 for serial)
+            concurrency: Maximum number of analyzer calls in flight at once
+            io_concurrency: Maximum number of repositories fetched and diffed at
+                once, None to use ``concurrency``
 
         Returns:
             CheckAllResult with reports, total commits, and status mapping
         """
-        if repos is None:
-            repos = self.list_enabled()
+        # The calling thread holds one connection for listing repositories and
+        # flushing their commits; every worker task holds its own.
+        with db.connection_context():
+            if repos is None:
+                repos = self.list_enabled()
+            return self._check_repos(repos, concurrency, io_concurrency or concurrency)
+
+    def _check_repos(
+        self,
+        repos: list[Repository],
+        concurrency: int,
+        io_concurrency: int,
+    ) -> CheckAllResult:
+        """Check the given repositories on a thread pool.
 
+        Git and GitHub work for up to ``io_concurrency`` repositories overlaps,
+        while analyzer calls queue on a semaphore of ``concurrency`` slots so
+        one slow analysis does not hold back the fetches behind it.
+
+        Args:
+            repos: List of repositories
+            concurrency: Maximum number of analyzer calls in flight at once
+            io_concurrency: Maximum number of repositories checked at once
+
+        Returns:
+            CheckAllResult with reports, total commits, and status mapping
+        """
         reports = []
         total_commits = 0
         repo_statuses = {}
@@ -479,7 +638,11 @@ class RepositoryManager:
             status = "failed"
             result: RepositoryReport | None = None
             try:
-                result = self.check(repo_obj)
+                # One pooled connection per task: every query of a repository
+                # check runs on it, and it goes back to the pool afterwards
+                # instead of lingering on the worker thread.
+                with db.connection_context():
+                    result = self.check(repo_obj)
                 status = "success" if result else "skipped"
             except Exception as e:
                 self.logger.error(
@@ -492,48 +655,40 @@ class RepositoryManager:
                 otel_context.detach(token)
             return result, status
 
-        if concurrency > 1:
+        # Commits are written in one transaction once every repository has been
+        # checked rather than committing (and syncing the WAL) once per repo.
+        self._pending_commits = []
+        self._analysis_slots = threading.BoundedSemaphore(max(1, concurrency))
+        try:
+            # Checks are dominated by blocking git/GitHub/analyzer I/O, so they
+            # always run on a pool; a single worker when both limits are 1.
+            workers = max(1, min(max(concurrency, io_concurrency), len(repos)))
             self.logger.info(
-                f"Using concurrent mode to check repositories (threads: {concurrency})"
+                f"Checking repositories (threads: {workers}, "
+                f"concurrent analyses: {concurrency})"
             )
-            lock = threading.Lock()
-
-            def process_with_lock(
-                repo_obj: Repository,
-            ) -> tuple[RepositoryReport | None, str]:
-                result, status = process(repo_obj)
-                with lock:
-                    repo_statuses[repo_obj.name] = status
-                return result, status
-
             with ThreadPoolExecutor(
-                max_workers=concurrency, thread_name_prefix="repo_checker"
+                max_workers=workers, thread_name_prefix="repo_checker"
             ) as executor:
-                futures = {
-                    executor.submit(process_with_lock, repo): repo for repo in repos
-                }
+                futures = {executor.submit(process, repo): repo for repo in repos}
+                # as_completed hands results back on this thread, so the
+                # accumulators below are never touched concurrently.
                 for future in as_completed(futures):
+                    repo = futures[future]
                     try:
                         result, status = future.result()
-                        if result:
-                            with lock:
-                                reports.append(result)
-                                total_commits += result.commit_count
                     except Exception as e:
-                        repo = futures[future]
                         self.logger.error(
                             f"Exception while processing repository {repo.name}: {e}"
                         )
-                        with lock:
-                            repo_statuses[repo.name] = "failed"
-        else:
-            self.logger.info("Using serial mode to check repositories")
-            for repo_obj in repos:
-                result, status = process(repo_obj)
-                repo_statuses[repo_obj.name] = status
-                if result:
-                    reports.append(result)
-                    total_commits += result.commit_count
+                        result, status = None, "failed"
+                    repo_statuses[repo.name] = status
+                    if result:
+                        reports.append(result)
+                        total_commits += result.commit_count
+        finally:
+            self._analysis_slots = nullcontext()
+            self._flush_pending_commits()
 
         return CheckAllResult(
             reports=reports, total_commits=total_commits, repo_statuses=repo_statuses
@@ -2,10 +2,11 @@
 
 import logging
 import os
+from contextlib import nullcontext
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from peewee import CharField, DateTimeField
+from peewee import CharField, DateTimeField, TextField
 from playhouse.migrate import SqliteMigrator, migrate
 from playhouse.pool import PooledSqliteDatabase
 
@@ -18,6 +19,7 @@ from progress.db.models import (
     Repository,
     database_proxy,
 )
+from progress.utils.markdown import render_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -175,8 +177,20 @@ def migrate_database():
         )
         database.execute_sql("DROP TABLE reports")
         database.execute_sql("ALTER TABLE reports_new RENAME TO reports")
+        Report._schema.create_indexes(safe=True)
         logger.info("Migration completed: 'repo' column is now nullable")
 
+    if "content_html" not in _existing_columns("reports"):
+        logger.info("Migrating: Adding 'content_html' column to reports table")
+        migrate(
+            migrator.add_column(
+                "reports",
+                "content_html",
+                TextField(null=True),
+            )
+        )
+        logger.info("Migration completed: 'content_html' column added")
+
     cursor = database.execute_sql("PRAGMA table_info(repositories)")
     repo_existing_columns = {row[1] for row in cursor.fetchall()}
 
@@ -229,6 +243,18 @@ def migrate_database():
         logger.info("Migration completed: 'discovered_repositories' dropped")
 
 
+def connection_context():
+    """Reuse the calling thread's open connection, or hold one for the block.
+
+    Peewee's ``connection_context()`` closes the connection on exit even when
+    it did not open it, so nesting one inside another would hand the outer
+    block's connection back to the pool early.
+    """
+    if not database.is_closed():
+        return nullcontext()
+    return database.connection_context()
+
+
 def close_db():
     """Close database connection."""
     global database
@@ -241,7 +267,7 @@ def create_tables():
     """Create database tables and migrate schema."""
     from progress.contrib.changelog.models import ChangelogTracker
     from progress.contrib.proposal.models import Proposal, ProposalTrackerState
-    from progress.contrib.repo.models import GitHubOwner
+    from progress.contrib.repo.models import AnalysisCache, GitHubOwner
 
     database.create_tables(
         [
@@ -251,6 +277,7 @@ def create_tables():
             AppConfig,
             GitHubOwner,
             ChangelogTracker,
+            AnalysisCache,
         ],
         safe=True,
     )
@@ -280,6 +307,9 @@ def save_report(
     title: str = "",
     report_type: str = "repo_update",
 ) -> int:
+    # Only aggregated reports (no repo) are served by the web routes; per-repo
+    # rows are rendered lazily by report_html if they are ever shown.
+    content_html = render_markdown(content) if repo_id is None else None
     report = Report.create(
         report_type=report_type,
         repo=repo_id,
@@ -289,6 +319,7 @@ def save_report(
         commit_count=commit_count,
         markpost_url=markpost_url or "",
         content=content,
+        content_html=content_html,
     )
     logger.info(f"Report saved: {report.id} (type={report_type})")
     return report.id
@@ -75,10 +75,16 @@ class Report(BaseModel):
     commit_count = IntegerField(default=1)
     markpost_url = CharField(null=True)
     content = TextField(null=True)
+    # HTML of ``content``, rendered once when the report is written so the web
+    # views never parse Markdown per request.
+    content_html = TextField(null=True)
     created_at = DateTimeField(default=lambda: datetime.now(UTC))
 
     class Meta:
         table_name = "reports"
+        # Serves the keyset-paginated report list, which seeks on
+        # (created_at, id) within reports of the same repo.
+        indexes = ((("repo_id", "created_at", "id"), False),)
 
     def save(self, *args, **kwargs):
         """Override save method to auto-update updated_at"""
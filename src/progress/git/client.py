@@ -1,6 +1,11 @@
 """Git client for low-level git operations."""
 
+import io
 import logging
+import re
+import subprocess
+import tempfile
+import threading
 from pathlib import Path
 from typing import List, Optional
 
@@ -8,6 +13,7 @@ import git
 
 from ..consts import (
     CMD_GIT,
+    DIFF_SPOOL_MAX_SIZE,
     GIT_MAX_RETRIES,
     TIMEOUT_GIT_COMMAND,
     WORKSPACE_DIR_DEFAULT,
@@ -71,8 +77,42 @@ class GitClient:
         self.workspace_dir = Path(workspace_dir)
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
         self.timeout = timeout
+        self._repos: dict[Path, git.Repo] = {}
+        self._repos_lock = threading.Lock()
         logger.debug(f"Git workspace directory: {self.workspace_dir}")
 
+    def _open_repo(self, repo_path: Path) -> git.Repo:
+        """Get a cached GitPython repository handle.
+
+        GitPython serves object reads through persistent ``git cat-file --batch``
+        processes owned by the ``Repo`` instance, so reusing the handle avoids
+        spawning new git processes for every query against the same repository.
+
+        Args:
+            repo_path: Repository path
+
+        Returns:
+            GitPython repository
+        """
+        key = Path(repo_path)
+        with self._repos_lock:
+            repo = self._repos.get(key)
+            if repo is None:
+                repo = git.Repo(str(key))
+                self._repos[key] = repo
+            return repo
+
+    def close_repo(self, repo_path: Path) -> None:
+        """Release the cached repository handle and its git processes.
+
+        Args:
+            repo_path: Repository path
+        """
+        with self._repos_lock:
+            repo = self._repos.pop(Path(repo_path), None)
+        if repo is not None:
+            repo.close()
+
     def _cleanup_git_locks(self, repo_path: Path):
         """Clean up git lock files.
 
@@ -95,7 +135,7 @@ class GitClient:
 
     def get_current_commit(self, repo_path: Path) -> str:
         """Get current commit hash."""
-        repo = git.Repo(str(repo_path))
+        repo = self._open_repo(repo_path)
         return repo.head.commit.hexsha
 
     def get_previous_commit(self, repo_path: Path) -> Optional[str]:
@@ -104,7 +144,7 @@ class GitClient:
         Returns:
             Second latest commit hash, or None if it doesn't exist
         """
-        repo = git.Repo(str(repo_path))
+        repo = self._open_repo(repo_path)
         try:
             return repo.head.commit.parents[0].hexsha
         except (IndexError, AttributeError):
@@ -123,7 +163,7 @@ class GitClient:
         Returns:
             Diff content
         """
-        repo = git.Repo(str(repo_path))
+        repo = self._open_repo(repo_path)
         if old_commit is None:
             old = repo.head.commit.parents[0] if repo.head.commit.parents else None
             new = repo.head.commit
@@ -136,12 +176,116 @@ class GitClient:
         else:
             diff = old.diff(new, create_patch=True, paths=None)
 
-        return "\n".join(
-            d.diff.decode("utf-8", errors="replace")
-            if isinstance(d.diff, bytes)
-            else str(d.diff)
-            for d in diff
+        # Spool the raw patch bytes (to disk past DIFF_SPOOL_MAX_SIZE) and drop
+        # each parsed patch once written, so a huge diff is never held as
+        # parsed patches, joined bytes and decoded text all at once.
+        with tempfile.SpooledTemporaryFile(max_size=DIFF_SPOOL_MAX_SIZE) as spool:
+            for i, d in enumerate(diff):
+                if i:
+                    spool.write(b"\n")
+                patch = d.diff
+                spool.write(
+                    patch if isinstance(patch, bytes) else str(patch).encode("utf-8")
+                )
+                diff[i] = None
+            spool.seek(0)
+            with io.TextIOWrapper(
+                spool, encoding="utf-8", errors="replace", newline=""
+            ) as text:
+                return text.read()
+
+    def get_diff_shortstat(
+        self, repo_path: Path, old_commit: str, new_commit: str
+    ) -> tuple[int, int, int]:
+        """Get the size of the diff between two commits without the patch.
+
+        Args:
+            repo_path: Repository path
+            old_commit: Old commit hash
+            new_commit: New commit hash
+
+        Returns:
+            (files_changed, insertions, deletions)
+        """
+        result = _run_git_command(
+            ["diff", "--shortstat", f"{old_commit}..{new_commit}"],
+            repo_path,
+            self.timeout,
         )
+        counts = {"file": 0, "insertion": 0, "deletion": 0}
+        for number, kind in re.findall(r"(\d+) (file|insertion|deletion)", result):
+            counts[kind] = int(number)
+        return counts["file"], counts["insertion"], counts["deletion"]
+
+    def get_capped_commit_diff(
+        self, repo_path: Path, old_commit: str, new_commit: str, max_file_lines: int
+    ) -> str:
+        """Get diff between two commits, keeping at most N lines per file.
+
+        The ``git diff`` output is streamed line by line, so a huge change is
+        never held in memory before being cut down.
+
+        Args:
+            repo_path: Repository path
+            old_commit: Old commit hash
+            new_commit: New commit hash
+            max_file_lines: Lines kept per file, including its headers
+
+        Returns:
+            Diff content with each file's patch capped
+
+        Raises:
+            GitException: If git diff fails or times out
+        """
+        cmd = [
+            CMD_GIT,
+            "-C",
+            str(repo_path),
+            "diff",
+            "--no-color",
+            f"{old_commit}..{new_commit}",
+        ]
+        kept: list[str] = []
+        file_lines = 0
+
+        def omitted_note() -> None:
+            if file_lines > max_file_lines:
+                omitted = file_lines - max_file_lines
+                kept.append(f"... ({omitted} more lines in this file omitted)\n")
+
+        # stderr goes to a file so a chatty git can never block on a full pipe
+        # while stdout is being read.
+        with (
+            tempfile.TemporaryFile() as stderr_file,
+            subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            ) as proc,
+        ):
+            timer = threading.Timer(self.timeout, proc.kill)
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    if line.startswith(b"diff --git "):
+                        omitted_note()
+                        file_lines = 0
+                    file_lines += 1
+                    if file_lines <= max_file_lines:
+                        kept.append(line.decode("utf-8", errors="replace"))
+                omitted_note()
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+
+        if returncode != 0:
+            raise GitException(
+                f"git diff {old_commit}..{new_commit} failed "
+                f"(exit {returncode}): {stderr.strip()}"
+            )
+        return "".join(kept)
 
     def get_changed_files(
         self, repo_path: Path, old_commit: Optional[str], new_commit: str
@@ -204,7 +348,7 @@ class GitClient:
         self, repo_path: Path, old_commit: Optional[str], new_commit: str
     ) -> List[str]:
         """Get list of commit messages (full messages including body)."""
-        repo = git.Repo(str(repo_path))
+        repo = self._open_repo(repo_path)
         if old_commit:
             old = repo.commit(old_commit)
             new = repo.commit(new_commit)
@@ -220,7 +364,7 @@ class GitClient:
         """Get commit count."""
         if not old_commit:
             return 1
-        repo = git.Repo(str(repo_path))
+        repo = self._open_repo(repo_path)
         old = repo.commit(old_commit)
         new = repo.commit(new_commit)
         return sum(1 for _ in repo.iter_commits(f"{old.hexsha}..{new.hexsha}"))
@@ -235,12 +379,12 @@ class GitClient:
         Returns:
             Commit hash, or None if it doesn't exist
         """
+        # Resolved through the cached repo's object database (persistent
+        # cat-file process) instead of spawning ``git rev-parse``.
+        repo = self._open_repo(repo_path)
         try:
-            result = _run_git_command(
-                ["rev-parse", f"HEAD~{n}"], repo_path, self.timeout
-            )
-            return result.strip() if result.strip() else None
-        except RuntimeError:
+            return repo.rev_parse(f"HEAD~{n}").hexsha
+        except (git.BadName, ValueError):
             return None
 
     def get_total_commit_count(self, repo_path: Path) -> int:
@@ -282,18 +426,55 @@ class GitClient:
             self.timeout,
         )
 
-    def fetch_and_reset(self, repo_path: Path, branch: str) -> None:
+    def get_remote_head(self, repo_path: Path, branch: str) -> Optional[str]:
+        """Get the commit hash the remote branch currently points to.
+
+        Uses ``git ls-remote``, which asks the remote for its refs without
+        downloading any objects.
+
+        Args:
+            repo_path: Repository path
+            branch: Branch name
+
+        Returns:
+            Remote branch commit hash, or None if the branch is not advertised
+        """
+        result = _run_git_command(
+            ["ls-remote", "origin", f"refs/heads/{branch}"], repo_path, self.timeout
+        )
+        for line in result.splitlines():
+            parts = line.split()
+            if parts:
+                return parts[0]
+        return None
+
+    def fetch_and_reset(
+        self,
+        repo_path: Path,
+        branch: str,
+        env: Optional[dict[str, str]] = None,
+        working_tree: bool = True,
+    ) -> None:
         """Fetch remote updates and force reset to remote branch.
 
         Args:
             repo_path: Repository path
             branch: Branch name
+            env: Extra environment variables for the fetch (optional)
+            working_tree: Also reset the index and files; False only moves HEAD,
+                which is enough for callers that read commits, never files
         """
         self._cleanup_git_locks(repo_path)
 
-        repo = git.Repo(str(repo_path))
-        repo.remotes.origin.fetch()
-        repo.head.reset(f"origin/{branch}", index=True, working_tree=True)
+        repo = self._open_repo(repo_path)
+        if env:
+            with repo.git.custom_environment(**env):
+                repo.remotes.origin.fetch()
+        else:
+            repo.remotes.origin.fetch()
+        repo.head.reset(
+            f"origin/{branch}", index=working_tree, working_tree=working_tree
+        )
 
 
 __all__ = [
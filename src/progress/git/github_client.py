@@ -2,6 +2,8 @@
 
 import logging
 import os
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -12,6 +14,7 @@ from github import (
     UnknownObjectException,
 )
 
+from ..consts import GITHUB_REPO_CACHE_TTL
 from ..errors import GitException
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,9 @@ class GitHubClient:
         if proxy:
             self._configure_proxy(proxy)
         self.github = Github(token)
+        # Shared by every thread checking repositories through this client.
+        self._repo_cache: dict[str, tuple[float, object]] = {}
+        self._repo_cache_lock = threading.Lock()
         logger.debug(
             f"GitHubClient initialized (token: {token[:8] + '...' if token else 'None'})"
         )
@@ -44,6 +50,28 @@ class GitHubClient:
             os.environ["ALL_PROXY"] = proxy
             os.environ["all_proxy"] = proxy
 
+    def _get_repo(self, owner: str, repo: str):
+        """Get a GitHub repository object, reusing a recent fetch.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            PyGithub Repository object
+        """
+        full_name = f"{owner}/{repo}"
+        now = time.monotonic()
+        with self._repo_cache_lock:
+            cached = self._repo_cache.get(full_name)
+        if cached and now - cached[0] < GITHUB_REPO_CACHE_TTL:
+            return cached[1]
+
+        repo_obj = self.github.get_repo(full_name)
+        with self._repo_cache_lock:
+            self._repo_cache[full_name] = (now, repo_obj)
+        return repo_obj
+
     def list_releases(
         self,
         owner: str,
@@ -68,7 +96,7 @@ class GitHubClient:
             GitException: If API call fails (except not found)
         """
         try:
-            repo_obj = self.github.get_repo(f"{owner}/{repo}")
+            repo_obj = self._get_repo(owner, repo)
             releases = repo_obj.get_releases()
 
             result = []
@@ -198,7 +226,7 @@ class GitHubClient:
             GitException: If release not found or API error
         """
         try:
-            repo_obj = self.github.get_repo(f"{owner}/{repo}")
+            repo_obj = self._get_repo(owner, repo)
             releases = repo_obj.get_releases()
 
             for release in releases:
@@ -250,7 +278,7 @@ class GitHubClient:
             GitException: If release not found or API error
         """
         try:
-            repo_obj = self.github.get_repo(f"{owner}/{repo}")
+            repo_obj = self._get_repo(owner, repo)
             releases = repo_obj.get_releases()
 
             for release in releases:
@@ -297,7 +325,7 @@ class GitHubClient:
             GitException: If API error (except not found)
         """
         try:
-            repo_obj = self.github.get_repo(f"{owner}/{repo}")
+            repo_obj = self._get_repo(owner, repo)
             readme_content = repo_obj.get_readme()
             content = readme_content.decoded_content.decode()
             logger.debug(f"Found README for {owner}/{repo}")
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from functools import lru_cache
 
 from ..consts import GIT_SUFFIX, GITHUB_HTTPS_PREFIX, GITHUB_SSH_PREFIX
 from ..enums import Protocol
@@ -94,6 +95,7 @@ def _parse_owner_repo(url: str) -> tuple[str, str]:
     raise ValueError(f"Invalid repository URL format: {url}")
 
 
+@lru_cache(maxsize=4096)
 def sanitize_repo_name(name: str) -> str:
     """Sanitize repository name to be safe for filesystem.
 
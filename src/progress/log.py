@@ -1,5 +1,7 @@
+import atexit
 import logging
 import logging.config
+import logging.handlers
 
 from .utils import canonicalify, ensure_path
 
@@ -50,10 +52,18 @@ LOGGING_CONFIG = {
             "maxBytes": 5 * 1024 * 1024,  # 5MB
             "backupCount": 100,
         },
+        # Worker threads only enqueue records; formatting and console/file
+        # writes happen on the listener thread started by setup(), so checks
+        # running in parallel do not contend on the handlers' I/O locks.
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "handlers": ["console", "file"],
+            "respect_handler_level": True,
+        },
     },
     "loggers": {
         "progress": {
-            "handlers": ["console", "file"],
+            "handlers": ["queue"],
             "level": logging.DEBUG,
             "propagate": True,
         }
@@ -70,6 +80,28 @@ def setup(logfile=None):
         ensure_path(p.parent)
 
     logging.config.dictConfig(LOGGING_CONFIG)
+    _start_queue_listener()
+
+
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _start_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    else:
+        atexit.register(_stop_queue_listener)
+    _queue_listener = logging.getHandlerByName("queue").listener
+    _queue_listener.start()
+
+
+def _stop_queue_listener() -> None:
+    """Drain queued records into the real handlers before exit."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
 
 
 logger = logging.getLogger("progress")
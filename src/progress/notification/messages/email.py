@@ -21,6 +21,20 @@ from .base import Message
 
 logger = logging.getLogger(__name__)
 
+_template_dir = Path(__file__).resolve().parents[2] / "templates"
+_jinja_env = Environment(
+    loader=FileSystemLoader(_template_dir),
+    autoescape=select_autoescape(),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
+_jinja_env.globals["_"] = _
+
+# Compiled once per process and shared by every EmailMessage instance, so
+# sending a notification never re-parses or re-stats the template source.
+_EMAIL_TEMPLATE = _jinja_env.get_template(TEMPLATE_EMAIL_NOTIFICATION)
+
 
 class EmailContext(NamedTuple):
     title: str
@@ -45,14 +59,6 @@ class EmailProposalContext(NamedTuple):
 class EmailMessage(Message):
     def __init__(self, channel: EmailChannel) -> None:
         super().__init__(channel)
-        template_dir = Path(__file__).resolve().parents[2] / "templates"
-        self._jinja_env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        self._jinja_env.globals["_"] = _
 
     def get_payload(self, context: EmailContext) -> str:
         subject_with_batch = add_batch_indicator(
@@ -69,8 +75,7 @@ class EmailMessage(Message):
 
     def _build_default_html(self, context: EmailContext) -> str:
         stats = compute_notification_stats(context.repo_statuses)
-        template = self._jinja_env.get_template(TEMPLATE_EMAIL_NOTIFICATION)
-        return template.render(
+        return _EMAIL_TEMPLATE.render(
             subject=context.title,
             summary=context.summary,
             total_commits=context.total_commits,
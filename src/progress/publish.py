@@ -24,6 +24,7 @@ from dataclasses import dataclass
 
 from .db.models import Batch, Report
 from .i18n import gettext as _
+from .utils import utf8_size
 from .utils.markpost import MarkpostClient
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 def byte_size(text: str) -> int:
     """UTF-8 byte length of ``text`` (MarkPost sizes bodies in bytes)."""
-    return len(text.encode("utf-8"))
+    return utf8_size(text)
 
 
 def build_report_url(web_base_url: str | None, report_id: int) -> str:
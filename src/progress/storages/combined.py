@@ -11,12 +11,27 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _external_url(results: list[str] | None) -> str | None:
+    # Markpost hands back URLs; file storage returns local paths, which are
+    # not recorded on the report row.
+    if results and results[0].startswith(("http://", "https://")):
+        return results[0]
+    return None
+
+
 class CombinedStorage:
     def __init__(self, primary: Storage) -> None:
         self._primary = primary
         self._db = DBStorage()
 
+    # The primary runs first so the database row is inserted once with its
+    # Markpost URL; the row is still written if the primary fails.
+
     def save(self, title: str, bodies: list[str]) -> list[str]:
         logger.debug("Saving to combined storage (primary + database)")
-        self._db.save(title, bodies)
-        return self._primary.save(title, bodies)
+        results = None
+        try:
+            results = self._primary.save(title, bodies)
+            return results
+        finally:
+            self._db.save(title, bodies, markpost_url=_external_url(results))
@@ -1,13 +1,31 @@
 import logging
 
+from progress.db import connection_context
+from progress.db.models import Report
+from progress.utils.markdown import render_markdown
+
 logger = logging.getLogger(__name__)
 
 
 class DBStorage:
-    def save(self, title: str, bodies: list[str]) -> list[str]:
-        from progress.db.models import Report
+    """Store reports as rows of the ``reports`` table.
+
+    Writes inherit the pool's WAL / ``synchronous=NORMAL`` pragmas: a commit
+    is atomic and survives an application crash, but the last transactions
+    before a power loss may be rolled back.
+    """
 
+    def save(
+        self, title: str, bodies: list[str], markpost_url: str | None = None
+    ) -> list[str]:
         logger.debug("Saving report to database")
         full_body = "\n\n".join(bodies)
-        report = Report.create(title=title, content=full_body, commit_hash="")
+        with connection_context():
+            report = Report.create(
+                title=title,
+                content=full_body,
+                content_html=render_markdown(full_body),
+                commit_hash="",
+                markpost_url=markpost_url,
+            )
         return [str(report.id)]
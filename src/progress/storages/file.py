@@ -1,4 +1,6 @@
+import itertools
 import logging
+import os
 from pathlib import Path
 from time import time_ns
 
@@ -6,6 +8,27 @@ from progress.errors import ProgressException
 
 logger = logging.getLogger(__name__)
 
+# O_EXCL makes a name collision fail instead of overwriting another report;
+# O_BINARY keeps Windows from translating newlines on the raw descriptor.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+# Disambiguates reports saved within the same clock tick by this process.
+_sequence = itertools.count()
+
+
+def _report_name() -> str:
+    return f"{time_ns()}_{next(_sequence)}.md"
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
 
 class FileStorage:
     def __init__(self, directory: str) -> None:
@@ -14,14 +37,30 @@ class FileStorage:
     def save(self, title: str, bodies: list[str]) -> list[str]:
         full_body = "\n\n".join(bodies)
         content = f"# {title}\n\n{full_body}"
-        path = self._directory / f"{time_ns()}.md"
+        path = self._directory / _report_name()
         logger.debug("Saving report to %s", path)
 
+        data = content.encode("utf-8")
+
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content, encoding="utf-8")
+            while True:
+                try:
+                    self._write(path, data)
+                    break
+                except FileExistsError:
+                    # Another process picked the same name; draw a new one.
+                    path = self._directory / _report_name()
         except OSError as e:
             logger.error("Failed to write report to %s: %s", path, e)
             raise ProgressException(f"Failed to write report to {path}: {e}") from e
 
         return [str(path)]
+
+    def _write(self, path: Path, data: bytes) -> None:
+        # The directory normally exists already, so it is only created when
+        # the first open reports it missing.
+        try:
+            _write_bytes(path, data)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_bytes(path, data)
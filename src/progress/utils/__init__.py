@@ -2,6 +2,7 @@
 
 import logging
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
@@ -21,6 +22,17 @@ BackoffStrategy = Literal["exponential", "fixed"]
 BATCH_MARGIN = 0.8
 
 
+def utf8_size(text: str) -> int:
+    """UTF-8 byte length of ``text`` without encoding it when it is ASCII.
+
+    ``str.isascii`` is a flag check on the string object, so the common
+    all-ASCII Markdown report is measured without allocating a bytes copy.
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-8"))
+
+
 def canonicalify(p: Path | str) -> Path:
     return Path(p).expanduser().resolve()
 
@@ -39,25 +51,31 @@ def retry(
     on_retry: Optional[Callable[[tuple, dict, Exception, int], None]] = None,
     max_delay: Optional[int] = None,
 ):
+    # The wait before each retry depends only on the decorator arguments, so
+    # the schedule is computed once here instead of on every failure.
+    delays = [initial_delay] * times
+    if backoff == "exponential":
+        for attempt in range(1, times):
+            delays[attempt] = initial_delay * 2**attempt
+            if max_delay is not None:
+                delays[attempt] = min(delays[attempt], max_delay)
+    last_attempt = times - 1
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            delay = initial_delay
-
             for attempt in range(times):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    is_last_attempt = attempt == times - 1
-                    error_msg = str(e)[:100]
-
-                    if is_last_attempt:
+                    if attempt == last_attempt:
                         logger.warning(f"Command failed, max retries ({times}) reached")
                         raise
 
+                    delay = delays[attempt]
                     logger.warning(
                         f"Command failed (attempt {attempt + 1}/{times}), "
-                        f"retrying in {delay}s. Error: {error_msg}"
+                        f"retrying in {delay}s. Error: {str(e)[:100]}"
                     )
 
                     if on_retry:
@@ -65,16 +83,66 @@ def retry(
 
                     time.sleep(delay)
 
-                    if backoff == "exponential":
-                        delay *= 2
-                        if max_delay is not None:
-                            delay = min(delay, max_delay)
-
         return wrapper
 
     return decorator
 
 
+class TokenBucket:
+    """Thread-safe per-minute limiter on requests and (estimated) tokens.
+
+    Both budgets refill continuously at ``limit / 60`` per second up to one
+    minute's worth; a limit of 0 disables that budget. One bucket shared by all
+    workers enforces the global rate, so there is no per-worker split.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._limits = (requests_per_minute, tokens_per_minute)
+        self._available = [float(requests_per_minute), float(tokens_per_minute)]
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until one request and ``tokens`` tokens fit in the budget.
+
+        Args:
+            tokens: Estimated tokens the request will consume; capped at the
+                per-minute limit so an oversized request waits for a full
+                bucket instead of forever
+        """
+        wanted = (1, min(tokens, self._limits[1]))
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = now - self._updated
+                self._updated = now
+                wait = 0.0
+                for i, limit in enumerate(self._limits):
+                    if not limit:
+                        continue
+                    self._available[i] = min(
+                        limit, self._available[i] + elapsed * limit / 60
+                    )
+                    if self._available[i] < wanted[i]:
+                        shortfall = wanted[i] - self._available[i]
+                        wait = max(wait, shortfall * 60 / limit)
+                if not wait:
+                    for i, limit in enumerate(self._limits):
+                        if limit:
+                            self._available[i] -= wanted[i]
+                    return
+            logger.debug(f"Rate limit reached, waiting {wait:.1f}s")
+            self._sleep(wait)
+
+
 def sanitize(sensitive: str | None, keep_chars: int = 2) -> str:
     """Mask sensitive information for logging.
 
@@ -159,6 +227,14 @@ def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     return dt.strftime(format_str)
 
 
+def _decode_output(data: bytes) -> str:
+    text = data.decode("utf-8", errors="replace")
+    # Same newline translation text mode applied, skipped when there is no \r.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def run_command(
     cmd: List[str],
     cwd: Optional[Path] = None,
@@ -166,6 +242,7 @@ def run_command(
     check: bool = True,
     input: Optional[str] = None,
     env: Optional[Dict[str, str]] = None,
+    close_fds: bool = True,
 ) -> str:
     """Run subprocess command and return stdout.
 
@@ -176,6 +253,7 @@ def run_command(
         check: If True, raise CalledProcessError for non-zero exit codes
         input: Input string to pass to stdin (optional)
         env: Environment variables (optional)
+        close_fds: Close inherited file descriptors in the child (default True)
 
     Returns:
         Command stdout output
@@ -187,29 +265,32 @@ def run_command(
     logger.debug(f"Executing: {cwd}$ {' '.join(cmd)}")
 
     try:
+        # Output is captured as bytes and decoded once at the end: diffs can be
+        # large and are not guaranteed to be valid UTF-8, which text mode would
+        # reject with a UnicodeDecodeError.
         result = subprocess.run(
             cmd,
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=timeout,
             check=check,
-            input=input,
+            input=input.encode("utf-8") if input is not None else None,
             env=env,
+            close_fds=close_fds,
         )
 
         if result.stderr:
-            logger.warning(f"Command stderr: {result.stderr}")
+            logger.warning(f"Command stderr: {_decode_output(result.stderr)}")
 
-        return result.stdout
+        return _decode_output(result.stdout)
 
     except subprocess.CalledProcessError as e:
         err = f"command failed: {e}\n"
         err += f"command: {' '.join(cmd)}\n"
         if e.stdout:
-            err += f"Stdout:\n{e.stdout.strip()}\n"
+            err += f"Stdout:\n{_decode_output(e.stdout).strip()}\n"
         if e.stderr:
-            err += f"Stderr:\n{e.stderr.strip()}\n"
+            err += f"Stderr:\n{_decode_output(e.stderr).strip()}\n"
 
         from progress.errors import CommandException
 
@@ -226,7 +307,7 @@ def run_command(
         raise CommandException("Failed to run command") from e
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportBatch:
     """A batch of repository reports."""
 
@@ -261,23 +342,18 @@ def create_report_batches(reports: list, max_batch_size: int) -> list[ReportBatc
         f"Batch size limit: {effective_limit} bytes ({BATCH_MARGIN} * {max_batch_size})"
     )
 
-    batches = []
+    # (reports, size) per batch; the ReportBatch objects are built once the
+    # total count is known, so each is created complete and exactly once.
+    groups: list[tuple[list, int]] = []
     current_batch = []
     current_size = 0
 
     for report in reports:
-        report_size = len(report.content.encode("utf-8"))
+        report_size = utf8_size(report.content)
 
         if report_size > effective_limit:
             if current_batch:
-                batches.append(
-                    ReportBatch(
-                        reports=current_batch,
-                        total_size=current_size,
-                        batch_index=len(batches),
-                        total_batches=0,
-                    )
-                )
+                groups.append((current_batch, current_size))
                 current_batch = []
                 current_size = 0
 
@@ -285,25 +361,11 @@ def create_report_batches(reports: list, max_batch_size: int) -> list[ReportBatc
                 f"Report for {report.repo_name} ({report_size} bytes) exceeds "
                 f"effective_limit ({effective_limit} bytes)"
             )
-            batches.append(
-                ReportBatch(
-                    reports=[report],
-                    total_size=report_size,
-                    batch_index=len(batches),
-                    total_batches=0,
-                )
-            )
+            groups.append(([report], report_size))
             continue
 
         if current_batch and current_size + report_size > effective_limit:
-            batches.append(
-                ReportBatch(
-                    reports=current_batch,
-                    total_size=current_size,
-                    batch_index=len(batches),
-                    total_batches=0,
-                )
-            )
+            groups.append((current_batch, current_size))
             current_batch = []
             current_size = 0
 
@@ -311,18 +373,18 @@ def create_report_batches(reports: list, max_batch_size: int) -> list[ReportBatc
         current_size += report_size
 
     if current_batch:
-        batches.append(
-            ReportBatch(
-                reports=current_batch,
-                total_size=current_size,
-                batch_index=len(batches),
-                total_batches=0,
-            )
+        groups.append((current_batch, current_size))
+
+    total_batches = len(groups)
+    batches = [
+        ReportBatch(
+            reports=batch_reports,
+            total_size=size,
+            batch_index=index,
+            total_batches=total_batches,
         )
-
-    total_batches = len(batches)
-    for batch in batches:
-        batch.total_batches = total_batches
+        for index, (batch_reports, size) in enumerate(groups)
+    ]
 
     logger.info(
         f"Created {total_batches} batch(es) from {len(reports)} report(s), "
@@ -134,6 +134,14 @@ def test_get_timezones(client: TestClient):
     assert response.status_code == 200
     data = response.json()
     assert "UTC" in data["timezones"]
+    assert data["timezones"] == sorted(data["timezones"])
+    assert response.headers["cache-control"] == "public, max-age=86400"
+
+    cached = client.get(
+        "/api/v1/config/timezones",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == 304
 
 
 def test_repos_replace_and_list(client: TestClient):
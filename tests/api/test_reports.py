@@ -1,6 +1,12 @@
+import base64
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
 import pytest
 from fastapi.testclient import TestClient
 
+from progress.api.routes import reports
+from progress.api.routes.reports import PAGE_SIZE, format_datetime
 from progress.db.models import Report
 
 
@@ -25,6 +31,7 @@ port = 5000
 
     monkeypatch.setenv("CONFIG_FILE", str(config_file))
     monkeypatch.setenv("PROGRESS_DB_PATH", str(tmp_path / "progress.db"))
+    monkeypatch.setattr(reports, "_report_count_cache", {"value": None, "ts": 0.0})
 
     from progress.api import create_app
 
@@ -63,3 +70,170 @@ def test_get_report_renders_markdown(client: TestClient):
     assert "<h1>Heading</h1>" in data["content"]
     assert "<details>" in data["content"]
     assert "<summary>Click</summary>" in data["content"]
+
+
+def test_get_report_serves_stored_html(client: TestClient):
+    report = Report.create(
+        title="Stored",
+        content="# Heading",
+        content_html="<p>stored html</p>",
+        repo=None,
+        commit_hash="test_commit",
+    )
+
+    response = client.get(f"/api/v1/reports/{report.id}")
+    assert response.status_code == 200
+    assert response.json()["content"] == "<p>stored html</p>"
+
+
+def test_get_report_backfills_missing_html(client: TestClient):
+    report = Report.create(
+        title="Legacy",
+        content="# Heading",
+        repo=None,
+        commit_hash="test_commit",
+    )
+    assert report.content_html is None
+
+    response = client.get(f"/api/v1/reports/{report.id}")
+    assert response.status_code == 200
+    assert response.json()["content"] == "<h1>Heading</h1>\n"
+    assert Report.get_by_id(report.id).content_html == "<h1>Heading</h1>\n"
+
+
+def _create_reports(count: int) -> None:
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    for i in range(count):
+        # Pairs of reports share a timestamp so the id tiebreaker is exercised.
+        Report.create(
+            title=f"Report {i}",
+            repo=None,
+            commit_hash="test_commit",
+            created_at=created_at + timedelta(minutes=i // 2),
+        )
+
+
+def test_list_reports_cursor_walks_every_report_once(client: TestClient):
+    _create_reports(PAGE_SIZE * 2 + 3)
+
+    seen = []
+    response = client.get("/api/v1/reports")
+    data = response.json()
+    seen.extend(r["id"] for r in data["reports"])
+    while data["has_next"]:
+        response = client.get("/api/v1/reports", params={"cursor": data["next_cursor"]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["has_prev"] is True
+        seen.extend(r["id"] for r in data["reports"])
+
+    assert data["next_cursor"] is None
+    expected = [
+        r.id
+        for r in Report.select().order_by(Report.created_at.desc(), Report.id.desc())
+    ]
+    assert seen == expected
+
+
+def test_list_reports_first_page_cursor_matches_page_two(client: TestClient):
+    _create_reports(PAGE_SIZE + 2)
+
+    first = client.get("/api/v1/reports").json()
+    by_page = client.get("/api/v1/reports", params={"page": 2}).json()
+    by_cursor = client.get(
+        "/api/v1/reports", params={"cursor": first["next_cursor"]}
+    ).json()
+
+    assert by_cursor["reports"] == by_page["reports"]
+    assert by_cursor["has_next"] is False
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        base64.urlsafe_b64encode(b'["not a date", 1]').decode(),
+        base64.urlsafe_b64encode(b'["2026-01-01 00:00:00+00:00", "1"]').decode(),
+    ],
+)
+def test_list_reports_rejects_malformed_cursor(client: TestClient, cursor: str):
+    response = client.get("/api/v1/reports", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_list_reports_rejects_page_with_cursor(client: TestClient):
+    _create_reports(PAGE_SIZE + 1)
+    cursor = client.get("/api/v1/reports").json()["next_cursor"]
+
+    response = client.get("/api/v1/reports", params={"cursor": cursor, "page": 2})
+    assert response.status_code == 400
+
+
+def test_list_reports_reuses_count_within_ttl(client: TestClient, monkeypatch):
+    _create_reports(1)
+    assert client.get("/api/v1/reports").json()["total"] == 1
+
+    _create_reports(1)
+    assert client.get("/api/v1/reports").json()["total"] == 1
+
+    monkeypatch.setattr(reports, "REPORT_COUNT_CACHE_TTL", 0)
+    assert client.get("/api/v1/reports").json()["total"] == 2
+
+
+def test_list_reports_has_next_does_not_wait_for_count(client: TestClient):
+    _create_reports(PAGE_SIZE)
+    assert client.get("/api/v1/reports").json()["has_next"] is False
+
+    _create_reports(1)
+    data = client.get("/api/v1/reports").json()
+    assert data["total"] == PAGE_SIZE
+    assert data["has_next"] is True
+
+
+def test_format_datetime_matches_strftime():
+    shanghai = ZoneInfo("Asia/Shanghai")
+    dt = datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=UTC)
+
+    assert format_datetime(dt, shanghai) == dt.astimezone(shanghai).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+    assert format_datetime(str(dt), shanghai) == "2024-01-02 11:04:05"
+    assert format_datetime("not a date", shanghai) == "not a date"
+    assert format_datetime(None, shanghai) == ""
+
+
+def test_get_report_revalidates_with_etag(client: TestClient):
+    report = Report.create(
+        title="Cached", content="# Heading", repo=None, commit_hash="test_commit"
+    )
+    url = f"/api/v1/reports/{report.id}"
+
+    etag = client.get(url).headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+    Report.update(markpost_url="https://markpost.example.com/p/1").where(
+        Report.id == report.id
+    ).execute()
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["markpost_url"] == "https://markpost.example.com/p/1"
+
+
+def test_get_report_etag_changes_with_title_and_content(client: TestClient):
+    report = Report.create(
+        title="Cached", content="# Heading", repo=None, commit_hash="test_commit"
+    )
+    url = f"/api/v1/reports/{report.id}"
+    etag = client.get(url).headers["etag"]
+
+    Report.update(title="Renamed").where(Report.id == report.id).execute()
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+    etag = response.headers["etag"]
+
+    Report.update(content_html="<p>Edited</p>").where(Report.id == report.id).execute()
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["content"] == "<p>Edited</p>"
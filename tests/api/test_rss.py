@@ -0,0 +1,107 @@
+from datetime import UTC, datetime
+from xml.etree import ElementTree
+
+import pytest
+from fastapi.testclient import TestClient
+
+from progress.db.models import Report
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(
+        """
+timezone = "UTC"
+language = "en"
+
+[github]
+gh_token = "test_token"
+
+[web]
+enabled = true
+host = "0.0.0.0"
+port = 5000
+""",
+        encoding="utf-8",
+    )
+
+    monkeypatch.setenv("CONFIG_FILE", str(config_file))
+    monkeypatch.setenv("PROGRESS_DB_PATH", str(tmp_path / "progress.db"))
+
+    from progress.api import create_app
+
+    app = create_app()
+    with TestClient(app) as client:
+        yield client
+
+
+def test_rss_dates_follow_requested_timezone(client: TestClient):
+    Report.create(
+        title="Feed Report",
+        content="# Heading",
+        repo=None,
+        commit_hash="test_commit",
+        created_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+    )
+
+    response = client.get("/api/v1/rss", params={"timezone_str": "Asia/Shanghai"})
+    assert response.status_code == 200
+    assert "<title>Feed Report</title>" in response.text
+    assert "<pubDate>Tue, 02 Jan 2024 11:04:05 +0800</pubDate>" in response.text
+
+
+def test_rss_is_well_formed_and_escapes_text(client: TestClient):
+    Report.create(
+        title="Fish & <Chips>",
+        content="Plain ]]> text",
+        repo=None,
+        commit_hash="test_commit",
+    )
+
+    response = client.get("/api/v1/rss")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/rss+xml; charset=utf-8"
+
+    channel = ElementTree.fromstring(response.content).find("channel")
+    assert channel.findtext("title") == "Progress Reports"
+    item = channel.find("item")
+    assert item.findtext("title") == "Fish & <Chips>"
+    assert item.findtext("description") == "<p>Plain ]]&gt; text</p>\n"
+    assert item.findtext("link").endswith("/report/1")
+    assert item.findtext("pubDate")
+
+
+def test_rss_revalidates_with_etag(client: TestClient):
+    Report.create(title="First", content="a", repo=None, commit_hash="c1")
+
+    first = client.get("/api/v1/rss")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    cached = client.get("/api/v1/rss", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    Report.create(title="Second", content="b", repo=None, commit_hash="c2")
+    refreshed = client.get("/api/v1/rss", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+
+
+def test_rss_etag_changes_with_title_and_content(client: TestClient):
+    report = Report.create(title="First", content="a", repo=None, commit_hash="c1")
+    first = client.get("/api/v1/rss")
+    assert client.get("/api/v1/rss").content == first.content
+    etag = first.headers["etag"]
+
+    Report.update(title="Renamed").where(Report.id == report.id).execute()
+    renamed = client.get("/api/v1/rss", headers={"If-None-Match": etag})
+    assert renamed.status_code == 200
+    assert b"Renamed" in renamed.content
+    etag = renamed.headers["etag"]
+
+    Report.update(content_html="<p>Edited</p>").where(Report.id == report.id).execute()
+    edited = client.get("/api/v1/rss", headers={"If-None-Match": etag})
+    assert edited.status_code == 200
+    assert b"Edited" in edited.content
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
 
+from progress.consts import ANALYSIS_CACHE_MAX_AGE_DAYS
 from progress.contrib.repo.analysis import (
     AnalysisResultParser,
     _extract_json,
@@ -11,7 +14,9 @@ from progress.contrib.repo.analysis import (
     analyze_readme,
     analyze_releases,
 )
+from progress.contrib.repo.models import AnalysisCache
 from progress.errors import AnalysisException
+from progress.utils import TokenBucket
 
 
 class TestExtractJson:
@@ -114,6 +119,7 @@ class TestAnalyzeDiff:
             commit_messages=["msg1"],
             max_diff_length=10000,
             language="en",
+            cache_policy="disabled",
         )
         analyzer.analyze.assert_called_once()
         call_kwargs = analyzer.analyze.call_args
@@ -130,6 +136,7 @@ class TestAnalyzeDiff:
             commit_messages=["msg"],
             max_diff_length=50,
             language="en",
+            cache_policy="disabled",
         )
         assert truncated is True
         assert orig_len == 100
@@ -145,6 +152,7 @@ class TestAnalyzeDiff:
             commit_messages=["msg"],
             max_diff_length=10000,
             language="en",
+            cache_policy="disabled",
         )
         assert truncated is False
         assert orig_len == analyzed_len
@@ -159,6 +167,7 @@ class TestAnalyzeDiff:
             commit_messages=["msg"],
             max_diff_length=10000,
             language="en",
+            cache_policy="disabled",
         )
         assert summary != ""
         assert detail != ""
@@ -184,6 +193,7 @@ class TestAnalyzeDiff:
             commit_messages=["msg"],
             max_diff_length=10000,
             language="en",
+            cache_policy="disabled",
         )
 
         assert len(reported) == 1
@@ -193,6 +203,125 @@ class TestAnalyzeDiff:
         assert counted == [{"provider": analyzer.provider, "reason": "parse"}]
 
 
+class TestAnalyzeDiffCache:
+    @pytest.fixture
+    def db(self, tmp_path):
+        from progress.db import close_db, create_tables, init_db
+
+        init_db(str(tmp_path / "test.db"))
+        create_tables()
+        yield
+        close_db()
+
+    def _analyze(
+        self, analyzer, cache_policy, diff="diff", params=None, analysis_slot=None
+    ):
+        analyzer.cache_params = params or {"provider": "claude_code"}
+        return analyze_diff(
+            analyzer,
+            repo_name="owner/repo",
+            branch="main",
+            diff=diff,
+            commit_messages=["msg"],
+            max_diff_length=10000,
+            language="en",
+            cache_policy=cache_policy,
+            analysis_slot=analysis_slot,
+        )
+
+    def test_reuses_analysis_of_identical_diff(self, db):
+        first = _make_analyzer(return_value=("s", "d"))
+        second = _make_analyzer(return_value=("other", "other"))
+
+        self._analyze(first, "enabled")
+        summary, detail, _, _, _ = self._analyze(second, "enabled")
+
+        assert (summary, detail) == ("s", "d")
+        second.analyze.assert_not_called()
+
+    def test_cache_miss_holds_analysis_slot(self, db):
+        slot = MagicMock()
+
+        self._analyze(_make_analyzer(), "enabled", diff="some diff", analysis_slot=slot)
+
+        slot.assert_called_once_with(len("some diff"))
+        slot.return_value.__enter__.assert_called_once()
+
+    def test_cache_hit_does_not_wait_on_rate_limit(self, db):
+        def fail_on_wait(seconds):
+            pytest.fail(f"cache hit waited {seconds}s on the rate limit")
+
+        bucket = TokenBucket(
+            requests_per_minute=1, clock=lambda: 0.0, sleep=fail_on_wait
+        )
+
+        @contextmanager
+        def slot(content_length):
+            bucket.acquire(content_length // 4)
+            yield
+
+        self._analyze(
+            _make_analyzer(return_value=("s", "d")), "enabled", analysis_slot=slot
+        )
+        analyzer = _make_analyzer(return_value=("s2", "d2"))
+
+        summary, _, _, _, _ = self._analyze(analyzer, "enabled", analysis_slot=slot)
+
+        assert summary == "s"
+        analyzer.analyze.assert_not_called()
+
+    def test_different_diff_misses_cache(self, db):
+        self._analyze(_make_analyzer(return_value=("s", "d")), "enabled")
+        analyzer = _make_analyzer(return_value=("s2", "d2"))
+
+        summary, _, _, _, _ = self._analyze(analyzer, "enabled", diff="changed")
+
+        assert summary == "s2"
+        analyzer.analyze.assert_called_once()
+
+    def test_different_analyzer_params_miss_cache(self, db):
+        params = {"provider": "truncate", "truncate_chars": 200}
+        self._analyze(_make_analyzer(return_value=("s", "d")), "enabled", params=params)
+        analyzer = _make_analyzer(return_value=("s2", "d2"))
+
+        summary, _, _, _, _ = self._analyze(
+            analyzer, "enabled", params={**params, "truncate_chars": 50}
+        )
+
+        assert summary == "s2"
+        analyzer.analyze.assert_called_once()
+
+    def test_expired_analysis_is_ignored_and_pruned(self, db):
+        self._analyze(_make_analyzer(return_value=("s", "d")), "enabled")
+        AnalysisCache.update(
+            created_at=datetime.now(UTC)
+            - timedelta(days=ANALYSIS_CACHE_MAX_AGE_DAYS + 1)
+        ).execute()
+        analyzer = _make_analyzer(return_value=("s2", "d2"))
+
+        summary, _, _, _, _ = self._analyze(analyzer, "enabled", diff="changed")
+        self._analyze(_make_analyzer(return_value=("s3", "d3")), "enabled")
+
+        assert summary == "s2"
+        assert AnalysisCache.select().count() == 2
+
+    def test_read_only_does_not_store(self, db):
+        self._analyze(_make_analyzer(return_value=("s", "d")), "read_only")
+        analyzer = _make_analyzer(return_value=("s2", "d2"))
+
+        summary, _, _, _, _ = self._analyze(analyzer, "enabled")
+
+        assert summary == "s2"
+
+    def test_failed_analysis_is_not_cached(self, db):
+        self._analyze(_make_analyzer(side_effect=Exception("timeout")), "enabled")
+        analyzer = _make_analyzer(return_value=("s", "d"))
+
+        self._analyze(analyzer, "enabled")
+
+        analyzer.analyze.assert_called_once()
+
+
 def _make_release_data():
     return {
         "releases": [{"tag": "v1.0"}],
@@ -3,13 +3,18 @@
 
 from __future__ import annotations
 
-import os
+import base64
+import contextlib
 import shutil
-import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+import requests
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT_DIR / "src"
 sys.path.insert(0, str(SRC_DIR))
@@ -52,155 +57,175 @@ class TestConsole:
         print(f"{TestConsole.BOLD}{TestConsole.BLUE}{'=' * 60}{TestConsole.RESET}\n")
 
 
-class GitHubCLI:
+CREATE_COMMIT_MUTATION = """
+mutation($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) { commit { oid } }
+}
+"""
+
+
+class GitHubAPI:
+    """Minimal GitHub REST/GraphQL client for setting up test repositories.
+
+    Every call goes through one pooled session, so the whole run shares a
+    handful of keep-alive connections instead of starting a ``gh`` process
+    and a TLS handshake per call.
+    """
+
+    BASE_URL = "https://api.github.com"
+    TIMEOUT = 30
+
     def __init__(self, gh_token: str) -> None:
         self.gh_token = gh_token
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {gh_token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+        )
         self.user = self.get_user()
+        # Head commit of each repo's main branch after our last write, so a
+        # commit does not need a lookup before it.
+        self._heads: dict[str, str] = {}
 
-    def repo_exists(self, owner: str, name: str) -> bool:
-        env = os.environ.copy()
-        env["GH_TOKEN"] = self.gh_token
-        result = subprocess.run(
-            ["gh", "repo", "view", f"{owner}/{name}"],
-            capture_output=True,
-            text=True,
-            check=False,
-            env=env,
+    def _request(self, method: str, path: str, check: bool = True, **kwargs):
+        response = self._session.request(
+            method, f"{self.BASE_URL}{path}", timeout=self.TIMEOUT, **kwargs
         )
-        return result.returncode == 0
-
-    def _run(self, args: list[str], check: bool = True) -> str:
-        env = os.environ.copy()
-        env["GH_TOKEN"] = self.gh_token
-        result = subprocess.run(
-            ["gh", *args],
-            capture_output=True,
-            text=True,
-            check=False,
-            env=env,
-        )
-        if check and result.returncode != 0:
-            stderr = result.stderr.strip()
-            stdout = result.stdout.strip()
+        if check and not response.ok:
             raise RuntimeError(
-                f"gh {' '.join(args)} failed (code={result.returncode})"
-                + (f"\nstdout:\n{stdout}" if stdout else "")
-                + (f"\nstderr:\n{stderr}" if stderr else "")
+                f"{method} {path} failed (status={response.status_code})"
+                + (f"\n{response.text.strip()}" if response.text else "")
             )
-        return result.stdout.strip()
+        if not response.content:
+            return None
+        return response.json()
+
+    def repo_exists(self, owner: str, name: str) -> bool:
+        response = self._session.get(
+            f"{self.BASE_URL}/repos/{owner}/{name}", timeout=self.TIMEOUT
+        )
+        return response.ok
 
     def get_user(self) -> str:
-        return self._run(["api", "/user", "--jq", ".login"])
+        return self._request("GET", "/user")["login"]
 
     def create_repo(
         self, owner: str, name: str, description: str = "", private: bool = False
     ) -> str:
-        args = [
-            "repo",
-            "create",
-            f"{owner}/{name}",
-            "--description",
-            description,
-            "--confirm",
-        ]
-        args.append("--private" if private else "--public")
-
-        return self._run(args)
+        path = "/user/repos" if owner == self.user else f"/orgs/{owner}/repos"
+        repo = self._request(
+            "POST",
+            path,
+            json={"name": name, "description": description, "private": private},
+        )
+        return repo["html_url"]
 
     def delete_repo(self, owner: str, name: str) -> None:
-        self._run(["repo", "delete", f"{owner}/{name}", "--yes"], check=False)
+        self._request("DELETE", f"/repos/{owner}/{name}", check=False)
 
     def create_release(
         self, owner: str, repo: str, tag: str, title: str, notes: str = ""
     ) -> None:
-        self._run(
-            [
-                "release",
-                "create",
-                tag,
-                "--repo",
-                f"{owner}/{repo}",
-                "--title",
-                title,
-                "--notes",
-                notes,
-            ]
+        self._request(
+            "POST",
+            f"/repos/{owner}/{repo}/releases",
+            json={"tag_name": tag, "name": title, "body": notes},
         )
 
-    def add_commit(
-        self, owner: str, repo: str, files: dict[str, str], message: str
-    ) -> None:
-        testing_root = ROOT_DIR / "data" / "testing-repos"
-        testing_root.mkdir(parents=True, exist_ok=True)
-        repo_path = testing_root / repo
-        if repo_path.exists():
-            shutil.rmtree(repo_path, ignore_errors=True)
-
-        ssh_key = Path.home() / ".ssh" / "id_wsl"
-        env = os.environ.copy()
-        env["GIT_SSH_COMMAND"] = f"ssh -i {ssh_key} -o IdentitiesOnly=yes"
-
-        clone_result = subprocess.run(
-            ["git", "clone", f"git@github.com:{owner}/{repo}.git", str(repo_path)],
-            capture_output=True,
-            text=True,
-            env=env,
+    def put_contents(
+        self,
+        owner: str,
+        repo: str,
+        path: str,
+        content: str,
+        message: str,
+        branch: str | None = "main",
+        sha: str | None = None,
+    ) -> str:
+        """Write one file through the contents API and return the new commit SHA."""
+        payload = {
+            "message": message,
+            "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+        }
+        if branch:
+            payload["branch"] = branch
+        if sha:
+            payload["sha"] = sha
+        result = self._request(
+            "PUT", f"/repos/{owner}/{repo}/contents/{path}", json=payload
         )
-        if clone_result.returncode != 0:
-            repo_path.mkdir(parents=True)
-            subprocess.run(
-                ["git", "init"], cwd=repo_path, check=True, capture_output=True
-            )
-            subprocess.run(
-                [
-                    "git",
-                    "remote",
-                    "add",
-                    "origin",
-                    f"git@github.com:{owner}/{repo}.git",
-                ],
-                cwd=repo_path,
-                check=True,
-                capture_output=True,
-            )
-
-        for rel_path, content in files.items():
-            full_path = repo_path / rel_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content, encoding="utf-8")
+        return result["commit"]["sha"]
 
-        subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
-        subprocess.run(
-            [
-                "git",
-                "-c",
-                "user.name=progress-integration",
-                "-c",
-                "user.email=progress-integration@example.invalid",
-                "commit",
-                "-m",
-                message,
-            ],
-            cwd=repo_path,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        push = subprocess.run(
-            ["git", "push"],
-            cwd=repo_path,
-            check=False,
-            capture_output=True,
-            text=True,
-            env=env,
+    def head_oid(self, owner: str, repo: str, branch: str = "main") -> str | None:
+        """Head commit of ``branch``, or None while the repo is empty."""
+        slug = f"{owner}/{repo}"
+        if slug not in self._heads:
+            try:
+                self._heads[slug] = self._request(
+                    "GET", f"/repos/{slug}/commits/{branch}"
+                )["sha"]
+            except RuntimeError:
+                return None
+        return self._heads[slug]
+
+    def create_commit_graphql(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        message: str,
+        files: dict[str, str],
+    ) -> str:
+        """Commit every file in one createCommitOnBranch mutation."""
+        slug = f"{owner}/{repo}"
+        variables = {
+            "input": {
+                "branch": {"repositoryNameWithOwner": slug, "branchName": branch},
+                "message": {"headline": message},
+                "expectedHeadOid": self.head_oid(owner, repo, branch),
+                "fileChanges": {
+                    "additions": [
+                        {
+                            "path": path,
+                            "contents": base64.b64encode(
+                                content.encode("utf-8")
+                            ).decode("ascii"),
+                        }
+                        for path, content in files.items()
+                    ]
+                },
+            }
+        }
+        result = self._request(
+            "POST",
+            "/graphql",
+            json={"query": CREATE_COMMIT_MUTATION, "variables": variables},
         )
-        if push.returncode != 0:
-            subprocess.run(
-                ["git", "push", "-u", "origin", "main"],
-                cwd=repo_path,
-                check=True,
-                env=env,
+        if result.get("errors"):
+            raise RuntimeError(
+                f"createCommitOnBranch on {slug} failed: {result['errors']}"
+            )
+        oid = result["data"]["createCommitOnBranch"]["commit"]["oid"]
+        self._heads[slug] = oid
+        return oid
+
+    def add_commit(
+        self, owner: str, repo: str, files: dict[str, str], message: str
+    ) -> None:
+        # createCommitOnBranch needs an existing branch, so a just-created
+        # empty repository gets its first file through the contents API.
+        files = dict(files)
+        if self.head_oid(owner, repo) is None:
+            path, content = next(iter(files.items()))
+            self._heads[f"{owner}/{repo}"] = self.put_contents(
+                owner, repo, path, content, message, branch=None
             )
+            del files[path]
+        if files:
+            self.create_commit_graphql(owner, repo, "main", message, files)
 
 
 def _assert(condition: bool, message: str) -> None:
@@ -208,6 +233,17 @@ def _assert(condition: bool, message: str) -> None:
         raise TestAssertionError(message)
 
 
+def _run_concurrently(*tasks):
+    """Run independent setup steps in parallel and return their results in order.
+
+    Each step is a chain of GitHub API calls that mostly waits on the network,
+    so threads are enough to overlap them. The first failure is re-raised.
+    """
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]
+
+
 @dataclass(frozen=True)
 class CreatedRepo:
     owner: str
@@ -234,7 +270,7 @@ class IntegrationTest:
         self.config_path = ROOT_DIR / "config" / "test_integration.toml"
         config = Config.load_from_file(str(self.config_path))
         self.gh_token = config.github.gh_token
-        self.gh = GitHubCLI(self.gh_token)
+        self.gh = GitHubAPI(self.gh_token)
         self.owner = self.gh.user
         self.testing_repo_name = "progress-testing"
         self.proposals_repo_name = "progress-proposals"
@@ -242,24 +278,49 @@ class IntegrationTest:
         self.created_repos: list[CreatedRepo] = []
         self.database_path = ROOT_DIR / "data" / "progress.db"
         self.reports_dir = ROOT_DIR / "data" / "reports"
-        self.testing_repos_dir = ROOT_DIR / "data" / "testing-repos"
+        self._sweeper: threading.Thread | None = None
 
     def cleanup_environment(self) -> None:
         if self.database_path.exists():
             self.database_path.unlink()
         if self.reports_dir.exists():
-            shutil.rmtree(self.reports_dir, ignore_errors=True)
-        if self.testing_repos_dir.exists():
-            shutil.rmtree(self.testing_repos_dir, ignore_errors=True)
+            # Renaming the previous reports out of the way is one syscall, so
+            # the run can start immediately; the files are deleted meanwhile.
+            stale = self.reports_dir.with_name(
+                f"{self.reports_dir.name}.stale-{time.time_ns()}"
+            )
+            self.reports_dir.rename(stale)
+            self._sweeper = threading.Thread(
+                target=shutil.rmtree,
+                args=(stale,),
+                kwargs={"ignore_errors": True},
+                name="reports_sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
 
     def cleanup_remote_repos(self) -> None:
-        test_repos = [
-            (self.owner, self.testing_repo_name),
-            (self.owner, self.proposals_repo_name),
-            (self.owner, self.new_repo_name),
-        ]
-        for owner, name in test_repos:
-            self.gh.delete_repo(owner, name)
+        self._delete_repos(
+            [
+                CreatedRepo(self.owner, self.testing_repo_name),
+                CreatedRepo(self.owner, self.proposals_repo_name),
+                CreatedRepo(self.owner, self.new_repo_name),
+            ]
+        )
+
+    def _delete_repos(self, repos: list[CreatedRepo]) -> None:
+        """Delete ``repos`` in parallel, reporting rather than raising failures."""
+        if not repos:
+            return
+        with ThreadPoolExecutor(max_workers=len(repos)) as executor:
+            futures = {
+                repo: executor.submit(self.gh.delete_repo, repo.owner, repo.name)
+                for repo in repos
+            }
+        for repo, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                self.console.error(f"Failed to delete {repo.slug}: {error}")
 
     def get_latest_report(self, directory: Path) -> Path | None:
         if not directory.exists():
@@ -267,7 +328,8 @@ class IntegrationTest:
         files = list(directory.glob("*.md"))
         if not files:
             return None
-        return max(files, key=lambda f: int(f.stem))
+        # File names are "<nanoseconds>_<sequence>"; compare both parts numerically.
+        return max(files, key=lambda f: tuple(map(int, f.stem.split("_"))))
 
     def verify_repo_update_report(self, expected_repos: list[str]) -> None:
         report = self.get_latest_report(self.reports_dir / "repo" / "update")
@@ -310,8 +372,15 @@ class IntegrationTest:
         _assert("🚀" in content, "No release found in report (missing 🚀 marker)")
 
     def create_initial_repos(self) -> tuple[CreatedRepo, CreatedRepo]:
+        # The two repositories do not depend on each other, so build them side
+        # by side; the steps within each one still run in order.
+        repo_main, repo_proposals = _run_concurrently(
+            self._create_main_repo, self._create_proposals_repo
+        )
+        return repo_main, repo_proposals
+
+    def _create_main_repo(self) -> CreatedRepo:
         repo_main = CreatedRepo(self.owner, self.testing_repo_name)
-        repo_proposals = CreatedRepo(self.owner, self.proposals_repo_name)
 
         self.console.info(f"Creating {repo_main.slug}...")
         self.gh.create_repo(
@@ -332,6 +401,10 @@ class IntegrationTest:
         self.gh.create_release(
             self.owner, repo_main.name, "v0.1.0", "v0.1.0", notes="Initial release"
         )
+        return repo_main
+
+    def _create_proposals_repo(self) -> CreatedRepo:
+        repo_proposals = CreatedRepo(self.owner, self.proposals_repo_name)
 
         self.console.info(f"Creating {repo_proposals.slug}...")
         self.gh.create_repo(
@@ -371,8 +444,7 @@ class IntegrationTest:
             },
             "Add initial PEPs",
         )
-
-        return repo_main, repo_proposals
+        return repo_proposals
 
     def run_progress(
         self,
@@ -381,18 +453,24 @@ class IntegrationTest:
         proposals_repo: CreatedRepo,
         changelog_repo: CreatedRepo,
     ) -> None:
-        result = subprocess.run(
-            ["uv", "run", "progress", "-c", str(self.config_path)],
-            cwd=ROOT_DIR,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
+        import click
+
+        from progress.cli import cli
+
+        # Run the CLI in this interpreter rather than through `uv run`: both
+        # runs skip environment resolution and the second reuses every module
+        # the first one imported.
+        try:
+            with contextlib.chdir(ROOT_DIR):
+                cli.main(
+                    args=["-c", str(self.config_path)],
+                    prog_name="progress",
+                    standalone_mode=False,
+                )
+        except click.ClickException as e:
             raise TestAssertionError(
-                "Progress execution failed"
-                + (f"\nstdout:\n{result.stdout.strip()}" if result.stdout else "")
-                + (f"\nstderr:\n{result.stderr.strip()}" if result.stderr else "")
-            )
+                f"Progress execution failed\n{e.format_message()}"
+            ) from e
 
     def verify_repositories(self, expected_repos: list[str]) -> None:
         from progress.db.models import Repository
@@ -413,43 +491,49 @@ class IntegrationTest:
             "Aggregated report empty",
         )
 
-    def verify_proposal_trackers(self) -> None:
-        from progress.contrib.proposal.models import ProposalTracker
-
-        pep_tracker = (
-            ProposalTracker.select()
-            .where(ProposalTracker.tracker_type == "pep")
-            .first()
-        )
-        _assert(pep_tracker is not None, "PEP tracker not found")
-        rust_tracker = (
-            ProposalTracker.select()
-            .where(ProposalTracker.tracker_type == "rust_rfc")
-            .first()
-        )
-        _assert(rust_tracker is not None, "Rust RFC tracker not found")
-
-    def verify_proposals(self) -> None:
-        from progress.contrib.proposal.models import PEP, RustRFC
-
-        _assert(PEP.select().count() > 0, "No PEPs found")
-        _assert(RustRFC.select().count() > 0, "No Rust RFCs found")
-
-    def verify_owners(self) -> None:
-        from progress.contrib.repo.models import GitHubOwner
-
-        _assert(GitHubOwner.select().count() >= 2, "Expected >= 2 owners")
-
-    def verify_changelog_trackers(self) -> None:
-        from progress.contrib.changelog.models import ChangelogTracker
-
-        _assert(
-            ChangelogTracker.select().count() >= 2, "Expected >= 2 changelog trackers"
-        )
+    def verify_tracking_tables(self) -> None:
+        from progress import db
+
+        # One statement for every count the first run checks, instead of a
+        # separate COUNT(*) round trip per table.
+        (
+            pep_trackers,
+            rfc_trackers,
+            peps,
+            rfcs,
+            owners,
+            changelog_trackers,
+        ) = db.database.execute_sql(
+            "SELECT"
+            " (SELECT COUNT(*) FROM proposal_trackers WHERE kind = ?),"
+            " (SELECT COUNT(*) FROM proposal_trackers WHERE kind = ?),"
+            " (SELECT COUNT(*) FROM proposals p"
+            "  JOIN proposal_trackers t ON p.tracker_id = t.id WHERE t.kind = ?),"
+            " (SELECT COUNT(*) FROM proposals p"
+            "  JOIN proposal_trackers t ON p.tracker_id = t.id WHERE t.kind = ?),"
+            " (SELECT COUNT(*) FROM github_owners),"
+            " (SELECT COUNT(*) FROM changelog_trackers)",
+            ("pep", "rfc", "pep", "rfc"),
+        ).fetchone()
+
+        _assert(pep_trackers > 0, "PEP tracker not found")
+        _assert(rfc_trackers > 0, "Rust RFC tracker not found")
+        _assert(peps > 0, "No PEPs found")
+        _assert(rfcs > 0, "No Rust RFCs found")
+        _assert(owners >= 2, "Expected >= 2 owners")
+        _assert(changelog_trackers >= 2, "Expected >= 2 changelog trackers")
 
     def evolve_repos(
         self, repo_main: CreatedRepo, repo_proposals: CreatedRepo
     ) -> CreatedRepo:
+        _, _, repo_new = _run_concurrently(
+            lambda: self._evolve_main_repo(repo_main),
+            lambda: self._evolve_proposals_repo(repo_proposals),
+            self._create_new_repo,
+        )
+        return repo_new
+
+    def _evolve_main_repo(self, repo_main: CreatedRepo) -> None:
         self.gh.add_commit(
             repo_main.owner,
             repo_main.name,
@@ -474,6 +558,7 @@ class IntegrationTest:
             notes="New feature release",
         )
 
+    def _evolve_proposals_repo(self, repo_proposals: CreatedRepo) -> None:
         pep1_updated = (
             ":PEP: 1\n"
             ":Title: Integration Test PEP\n"
@@ -504,6 +589,7 @@ class IntegrationTest:
             "Update PEP 1 status and add PEP 3",
         )
 
+    def _create_new_repo(self) -> CreatedRepo:
         repo_new = CreatedRepo(self.owner, self.new_repo_name)
         self.console.info(f"Creating {repo_new.slug}...")
         self.gh.create_repo(
@@ -519,9 +605,9 @@ class IntegrationTest:
         return repo_new
 
     def cleanup_repos(self) -> None:
-        for r in reversed(self.created_repos):
+        for r in self.created_repos:
             self.console.info(f"Deleting {r.slug}...")
-            self.gh.delete_repo(r.owner, r.name)
+        self._delete_repos(self.created_repos)
 
     def verify_first_run(self, repo_main: CreatedRepo) -> None:
         from progress.db import close_db, create_tables, init_db
@@ -531,10 +617,7 @@ class IntegrationTest:
         try:
             self.verify_repositories([repo_main.slug, "sergi0g/cup"])
             self.verify_reports()
-            self.verify_proposal_trackers()
-            self.verify_proposals()
-            self.verify_owners()
-            self.verify_changelog_trackers()
+            self.verify_tracking_tables()
         finally:
             close_db()
         self.verify_repo_update_report([repo_main.slug])
@@ -600,6 +683,8 @@ class IntegrationTest:
                 ...
             except Exception as e:
                 self.console.error(f"Repository cleanup failed: {e}")
+            if self._sweeper is not None:
+                self._sweeper.join()
 
 
 def main() -> int:
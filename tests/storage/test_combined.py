@@ -1,9 +1,11 @@
 from unittest.mock import Mock, patch
 
+import pytest
+
 from progress.storages.combined import CombinedStorage
 
 
-def test_combined_storage_saves_to_db_then_primary():
+def test_combined_storage_saves_to_primary_and_db():
     mock_primary = Mock()
     mock_primary.save.return_value = ["/tmp/report.md"]
 
@@ -15,7 +17,7 @@ def test_combined_storage_saves_to_db_then_primary():
         result = storage.save("Title", ["Body"])
 
         assert result == ["/tmp/report.md"]
-        mock_db.save.assert_called_once_with("Title", ["Body"])
+        mock_db.save.assert_called_once_with("Title", ["Body"], markpost_url=None)
         mock_primary.save.assert_called_once_with("Title", ["Body"])
 
 
@@ -23,8 +25,25 @@ def test_combined_storage_returns_primary_result():
     mock_primary = Mock()
     mock_primary.save.return_value = ["https://example.com/p/123"]
 
-    with patch("progress.storages.combined.DBStorage"):
+    with patch("progress.storages.combined.DBStorage") as db_cls:
         storage = CombinedStorage(mock_primary)
         result = storage.save("Title", ["Body"])
 
         assert result == ["https://example.com/p/123"]
+        db_cls.return_value.save.assert_called_once_with(
+            "Title", ["Body"], markpost_url="https://example.com/p/123"
+        )
+
+
+def test_combined_storage_records_report_when_primary_fails():
+    mock_primary = Mock()
+    mock_primary.save.side_effect = RuntimeError("boom")
+
+    with patch("progress.storages.combined.DBStorage") as db_cls:
+        storage = CombinedStorage(mock_primary)
+        with pytest.raises(RuntimeError):
+            storage.save("Title", ["Body"])
+
+        db_cls.return_value.save.assert_called_once_with(
+            "Title", ["Body"], markpost_url=None
+        )
@@ -7,7 +7,10 @@ def test_db_storage_creates_report_and_returns_id():
     mock_report = Mock()
     mock_report.id = 123
 
-    with patch("progress.db.models.Report") as report_model:
+    with (
+        patch("progress.storages.db.connection_context"),
+        patch("progress.storages.db.Report") as report_model,
+    ):
         report_model.create.return_value = mock_report
 
         storage = DBStorage()
@@ -15,7 +18,11 @@ def test_db_storage_creates_report_and_returns_id():
 
         assert result == ["123"]
         report_model.create.assert_called_once_with(
-            title="Title", content="Body 1\n\nBody 2", commit_hash=""
+            title="Title",
+            content="Body 1\n\nBody 2",
+            content_html="<p>Body 1</p>\n<p>Body 2</p>\n",
+            commit_hash="",
+            markpost_url=None,
         )
 
 
@@ -23,7 +30,10 @@ def test_db_storage_joins_bodies():
     mock_report = Mock()
     mock_report.id = 456
 
-    with patch("progress.db.models.Report") as report_model:
+    with (
+        patch("progress.storages.db.connection_context"),
+        patch("progress.storages.db.Report") as report_model,
+    ):
         report_model.create.return_value = mock_report
 
         storage = DBStorage()
@@ -37,7 +47,10 @@ def test_db_storage_single_body():
     mock_report = Mock()
     mock_report.id = 789
 
-    with patch("progress.db.models.Report") as report_model:
+    with (
+        patch("progress.storages.db.connection_context"),
+        patch("progress.storages.db.Report") as report_model,
+    ):
         report_model.create.return_value = mock_report
 
         storage = DBStorage()
@@ -46,3 +59,18 @@ def test_db_storage_single_body():
         assert result == ["789"]
         call_kwargs = report_model.create.call_args.kwargs
         assert call_kwargs["content"] == "Only body"
+
+
+def test_db_storage_returns_connection_to_pool(tmp_path):
+    from progress.db import close_db, create_tables, init_db
+    from progress.db.models import database_proxy
+
+    init_db(str(tmp_path / "test.db"))
+    create_tables()
+    database_proxy.close()
+    try:
+        DBStorage().save("Title", ["Body"])
+
+        assert database_proxy.is_closed()
+    finally:
+        close_db()
@@ -60,3 +60,34 @@ def test_file_storage_returns_list(tmp_path):
 
     assert isinstance(result, list)
     assert len(result) == 1
+
+
+def test_file_storage_writes_exact_bytes(tmp_path):
+    body = "línea\n" * 10000
+    storage = FileStorage(str(tmp_path / "new"))
+    result = storage.save("Título", [body])
+
+    saved = Path(result[0])
+    assert saved.read_bytes() == f"# Título\n\n{body}".encode()
+
+
+def test_file_storage_never_overwrites_existing_report(tmp_path, monkeypatch):
+    names = iter(["taken.md", "taken.md", "fresh.md"])
+    monkeypatch.setattr("progress.storages.file._report_name", lambda: next(names))
+
+    storage = FileStorage(str(tmp_path))
+    first = storage.save("First", ["Body"])
+    second = storage.save("Second", ["Body"])
+
+    assert first == [str(tmp_path / "taken.md")]
+    assert second == [str(tmp_path / "fresh.md")]
+    assert (tmp_path / "taken.md").read_text(encoding="utf-8").startswith("# First")
+
+
+def test_file_storage_names_are_unique_within_a_tick(tmp_path, monkeypatch):
+    monkeypatch.setattr("progress.storages.file.time_ns", lambda: 1)
+
+    storage = FileStorage(str(tmp_path))
+    paths = {storage.save("Title", ["Body"])[0] for _ in range(3)}
+
+    assert len(paths) == 3
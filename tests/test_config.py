@@ -180,6 +180,26 @@ gh_token = "ghp_test"
         Config.load_from_file(temp_config_file)
 
 
+def test_timezone_names_scanned_once(monkeypatch):
+    """Test: tzdata is walked once, not on every timezone validation"""
+    import progress.config as config_module
+
+    calls = []
+
+    def fake_available_timezones():
+        calls.append(1)
+        return {"UTC"}
+
+    config_module.timezone_names.cache_clear()
+    monkeypatch.setattr(config_module, "available_timezones", fake_available_timezones)
+    try:
+        assert Config.validate_timezone("UTC") == "UTC"
+        assert Config.validate_timezone("UTC") == "UTC"
+        assert len(calls) == 1
+    finally:
+        config_module.timezone_names.cache_clear()
+
+
 def test_invalid_port_range(temp_config_file):
     """Test: Port out of range"""
     content = """
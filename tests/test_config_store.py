@@ -226,3 +226,72 @@ def test_import_overwrites_and_bumps_version(db):
     data, _ = load_app_config()
     assert data["language"] == "ja"
     assert data["github"]["gh_token"] == "ghp_new"
+
+
+def test_replace_repositories_upserts_and_prunes(db):
+    from progress.config import RepositoryConfig
+    from progress.contrib.repo.repository import replace_repositories
+    from progress.db.models import Repository
+
+    Repository.create(
+        name="vitejs/vite",
+        url="https://github.com/vitejs/vite.git",
+        branch="main",
+        last_commit_hash="abc123",
+    )
+    Repository.create(
+        name="django/django", url="https://github.com/django/django.git", branch="main"
+    )
+
+    result = replace_repositories(
+        [
+            RepositoryConfig(url="vitejs/vite", branch="dev", enabled=False),
+            RepositoryConfig(url="vue/core"),
+        ],
+        "https",
+    )
+
+    assert (result.created, result.updated, result.deleted) == (1, 1, 1)
+    vite = Repository.get(Repository.url == "https://github.com/vitejs/vite.git")
+    assert vite.branch == "dev"
+    assert vite.enabled is False
+    assert vite.last_commit_hash == "abc123"
+    assert {r.url for r in Repository.select()} == {
+        "https://github.com/vitejs/vite.git",
+        "https://github.com/vue/core.git",
+    }
+
+
+def test_replace_repositories_batches_inserts_in_config_order(db, monkeypatch):
+    from progress.config import RepositoryConfig
+    from progress.contrib.repo import repository
+    from progress.db.models import Repository
+
+    monkeypatch.setattr(repository, "DB_BATCH_SIZE", 2)
+    insert_many = Repository.insert_many
+    batches = []
+
+    def spy(rows, *args, **kwargs):
+        batches.append([row["url"] for row in rows])
+        return insert_many(rows, *args, **kwargs)
+
+    monkeypatch.setattr(Repository, "insert_many", spy)
+    names = ["zeta/z", "alpha/a", "mid/m", "beta/b", "omega/o"]
+
+    result = repository.replace_repositories(
+        [RepositoryConfig(url=name) for name in names], "https"
+    )
+
+    assert result.created == 5
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    # The config page lists repositories by id, so rows keep config order.
+    ordered = Repository.select().order_by(Repository.id)
+    assert [r.name for r in ordered] == names
+
+
+def test_schema_callers_get_independent_copies():
+    first = get_config_json_schema()
+    first["properties"].clear()
+    second = get_config_json_schema()
+    assert "github" in second["properties"]
+    assert second is not get_config_json_schema()
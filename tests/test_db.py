@@ -0,0 +1,76 @@
+"""Tests for database initialization."""
+
+from progress import db
+from progress.db import close_db, init_db
+
+
+def test_init_db_applies_wal_and_normal_sync(tmp_path):
+    init_db(str(tmp_path / "test.db"))
+    try:
+        assert db.database.execute_sql("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # synchronous: 0=OFF, 1=NORMAL, 2=FULL
+        assert db.database.execute_sql("PRAGMA synchronous").fetchone()[0] == 1
+        assert db.database.execute_sql("PRAGMA busy_timeout").fetchone()[0] == 5000
+        # temp_store: 0=DEFAULT, 1=FILE, 2=MEMORY
+        assert db.database.execute_sql("PRAGMA temp_store").fetchone()[0] == 2
+        assert (
+            db.database.execute_sql("PRAGMA mmap_size").fetchone()[0]
+            == 256 * 1024 * 1024
+        )
+    finally:
+        close_db()
+
+
+def test_migration_adds_content_html_and_save_report_fills_it(tmp_path):
+    from progress.db import create_tables, save_report
+    from progress.db.models import Report
+
+    init_db(str(tmp_path / "test.db"))
+    try:
+        db.database.execute_sql(
+            "CREATE TABLE reports ("
+            "id INTEGER PRIMARY KEY,"
+            "repo_id INTEGER NULL,"
+            "title VARCHAR NOT NULL DEFAULT '',"
+            "report_type VARCHAR NOT NULL DEFAULT 'repo_update',"
+            "commit_hash VARCHAR NOT NULL,"
+            "previous_commit_hash VARCHAR,"
+            "commit_count INTEGER NOT NULL DEFAULT 1,"
+            "markpost_url VARCHAR,"
+            "content TEXT,"
+            "created_at VARCHAR NOT NULL)"
+        )
+        create_tables()
+
+        columns = {
+            row[1] for row in db.database.execute_sql("PRAGMA table_info(reports)")
+        }
+        assert "content_html" in columns
+
+        indexes = {
+            row[1] for row in db.database.execute_sql("PRAGMA index_list(reports)")
+        }
+        assert "report_repo_id_created_at_id" in indexes
+
+        report_id = save_report(content="# Title", title="Report")
+        assert Report.get_by_id(report_id).content_html == "<h1>Title</h1>\n"
+    finally:
+        close_db()
+
+
+def test_save_report_skips_html_for_repository_reports(tmp_path):
+    from progress.db import create_tables, save_report
+    from progress.db.models import Report, Repository
+
+    init_db(str(tmp_path / "test.db"))
+    try:
+        create_tables()
+        repo = Repository.create(
+            name="owner/repo", url="https://github.com/owner/repo.git", branch="main"
+        )
+
+        report_id = save_report(repo_id=repo.id, content="# Title")
+
+        assert Report.get_by_id(report_id).content_html is None
+    finally:
+        close_db()
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
@@ -77,6 +78,31 @@ def test_git_client_get_current_commit_with_gitpython(monkeypatch):
     assert commit == "abc123def456"
 
 
+def test_git_client_reuses_repo_handle_until_closed(monkeypatch):
+    opened = []
+
+    def fake_repo_open(path):
+        repo = Mock()
+        repo.head.commit.hexsha = "abc123"
+        repo.head.commit.parents = []
+        opened.append(repo)
+        return repo
+
+    monkeypatch.setattr("git.Repo", fake_repo_open)
+    client = GitClient("/tmp/test_workspace")
+    repo_path = Path("/tmp/test_workspace/test_repo")
+
+    client.get_current_commit(repo_path)
+    client.get_previous_commit(repo_path)
+    assert len(opened) == 1
+
+    client.close_repo(repo_path)
+    opened[0].close.assert_called_once()
+
+    client.get_current_commit(repo_path)
+    assert len(opened) == 2
+
+
 def test_git_client_get_previous_commit_with_gitpython(monkeypatch):
     from types import SimpleNamespace
 
@@ -184,6 +210,100 @@ def test_git_client_get_commit_diff_with_gitpython(monkeypatch):
     assert diff == expected_diff
 
 
+def test_git_client_get_commit_diff_joins_byte_patches(monkeypatch):
+    from types import SimpleNamespace
+
+    diffs = [
+        SimpleNamespace(diff=b"@@ a @@\n+caf\xc3\xa9"),
+        SimpleNamespace(diff=b"@@ b @@\n+\xff"),
+    ]
+    old = SimpleNamespace(diff=lambda new, **kwargs: diffs)
+    mock_repo = SimpleNamespace(commit=lambda sha: old)
+    monkeypatch.setattr("git.Repo", lambda p: mock_repo)
+    client = GitClient("/tmp/test_workspace")
+
+    diff = client.get_commit_diff(Path("/tmp/test_workspace"), "abc", "def")
+    assert diff == "@@ a @@\n+caf\u00e9\n@@ b @@\n+\ufffd"
+
+
+def test_git_client_get_commit_diff_spills_large_diffs(monkeypatch):
+    from types import SimpleNamespace
+
+    diffs = [
+        SimpleNamespace(diff=b"@@ a @@\r\n+" + b"x" * 64),
+        SimpleNamespace(diff=b"@@ b @@\n+caf\xc3\xa9"),
+    ]
+    old = SimpleNamespace(diff=lambda new, **kwargs: diffs)
+    mock_repo = SimpleNamespace(commit=lambda sha: old)
+    monkeypatch.setattr("git.Repo", lambda p: mock_repo)
+    monkeypatch.setattr("progress.git.client.DIFF_SPOOL_MAX_SIZE", 16)
+    client = GitClient("/tmp/test_workspace")
+
+    diff = client.get_commit_diff(Path("/tmp/test_workspace"), "abc", "def")
+    assert diff == "@@ a @@\r\n+" + "x" * 64 + "\n@@ b @@\n+caf\u00e9"
+    assert diffs == [None, None]
+
+
+def test_git_client_caps_each_file_of_large_diff(tmp_path):
+    import subprocess
+
+    def run_git(*args):
+        return subprocess.check_output(
+            ["git", "-C", str(tmp_path), *args], text=True
+        ).strip()
+
+    run_git("init", "-q")
+    run_git("config", "user.email", "test@example.com")
+    run_git("config", "user.name", "test")
+    (tmp_path / "big.txt").write_text("")
+    (tmp_path / "small.txt").write_text("")
+    run_git("add", ".")
+    run_git("commit", "-qm", "initial")
+    old = run_git("rev-parse", "HEAD")
+    (tmp_path / "big.txt").write_text("".join(f"line {i}\n" for i in range(50)))
+    (tmp_path / "small.txt").write_text("one\n")
+    run_git("commit", "-qam", "change")
+    new = run_git("rev-parse", "HEAD")
+
+    client = GitClient(str(tmp_path / "workspace"))
+    assert client.get_diff_shortstat(tmp_path, old, new) == (2, 51, 0)
+
+    diff = client.get_capped_commit_diff(tmp_path, old, new, max_file_lines=10)
+    big, small = diff.split("diff --git a/small.txt")
+    assert "+line 3\n" in big
+    assert "+line 49" not in big
+    assert "more lines in this file omitted" in big
+    assert "+one\n" in small
+    assert "omitted" not in small
+
+
+def test_git_client_get_nth_commit_from_head(monkeypatch):
+    import git
+
+    def rev_parse(rev):
+        if rev == "HEAD~2":
+            return SimpleNamespace(hexsha="abc123")
+        raise git.BadName(rev)
+
+    monkeypatch.setattr("git.Repo", lambda p: SimpleNamespace(rev_parse=rev_parse))
+    client = GitClient("/tmp/test_workspace")
+    repo_path = Path("/tmp/test_workspace/repo")
+
+    assert client.get_nth_commit_from_head(repo_path, 2) == "abc123"
+    assert client.get_nth_commit_from_head(repo_path, 50) is None
+
+
+def test_git_client_get_remote_head(monkeypatch):
+    client = GitClient("/tmp/test_workspace")
+
+    def fake_run_git_command(args, repo_path, timeout):
+        assert args == ["ls-remote", "origin", "refs/heads/main"]
+        return "abc123\trefs/heads/main\n"
+
+    monkeypatch.setattr("progress.git.client._run_git_command", fake_run_git_command)
+    assert client.get_remote_head(Path("/tmp/test_workspace/repo"), "main") == "abc123"
+
+
 def test_git_client_fetch_and_reset_with_gitpython(monkeypatch, tmp_path):
     from types import SimpleNamespace
     from unittest.mock import Mock
@@ -200,7 +320,15 @@ def test_git_client_fetch_and_reset_with_gitpython(monkeypatch, tmp_path):
 
     client.fetch_and_reset(tmp_path / "test_repo", "main")
     mock_remote.fetch.assert_called_once()
-    mock_head.reset.assert_called_once()
+    mock_head.reset.assert_called_once_with(
+        "origin/main", index=True, working_tree=True
+    )
+
+    mock_head.reset.reset_mock()
+    client.fetch_and_reset(tmp_path / "test_repo", "main", working_tree=False)
+    mock_head.reset.assert_called_once_with(
+        "origin/main", index=False, working_tree=False
+    )
 
 
 @pytest.mark.parametrize(
@@ -269,6 +397,9 @@ def test_repository_manager_first_check_total_commits_le_1(monkeypatch):
     class FakeGitClient:
         workspace_dir = Path("/tmp")
 
+        def close_repo(self, repo_path):
+            pass
+
         def get_current_commit(self, repo_path):
             return "c" * 40
 
@@ -303,7 +434,12 @@ def test_repository_manager_first_check_total_commits_le_1(monkeypatch):
     cfg = SimpleNamespace(
         workspace_dir="/tmp/ws",
         analysis=SimpleNamespace(
-            first_run_lookback_commits=3, language="en", max_diff_length=100000
+            first_run_lookback_commits=3,
+            language="en",
+            max_diff_length=100000,
+            cache_policy="disabled",
+            requests_per_minute=0,
+            tokens_per_minute=0,
         ),
         github=SimpleNamespace(
             gh_timeout=300, gh_token=None, proxy=None, protocol="https", git_timeout=300
@@ -342,6 +478,9 @@ def test_repository_manager_first_check_uses_range_when_history_sufficient(monke
     class FakeGitClient:
         workspace_dir = Path("/tmp")
 
+        def close_repo(self, repo_path):
+            pass
+
         def get_current_commit(self, repo_path):
             return "n" * 40
 
@@ -355,10 +494,10 @@ def test_repository_manager_first_check_uses_range_when_history_sufficient(monke
         def get_commit_messages(self, repo_path, old_commit, new_commit):
             assert old_commit == "b" * 40
             assert new_commit == "n" * 40
-            return ["m"]
+            return ["m1", "m2", "m3"]
 
-        def get_commit_count(self, repo_path, old_commit, new_commit):
-            return 3
+        def get_diff_shortstat(self, repo_path, old_commit, new_commit):
+            return 1, 1, 0
 
         def get_commit_diff(self, repo_path, old_commit, new_commit):
             return "diff"
@@ -366,7 +505,7 @@ def test_repository_manager_first_check_uses_range_when_history_sufficient(monke
     class FakeAnalyzer:
         def analyze_diff(self, repo_name, branch, diff, commit_messages):
             assert diff == "diff"
-            assert commit_messages == ["m"]
+            assert commit_messages == ["m1", "m2", "m3"]
             return ("report", "detail", False, 4, 4)
 
     repo = SimpleNamespace(
@@ -379,7 +518,12 @@ def test_repository_manager_first_check_uses_range_when_history_sufficient(monke
     cfg = SimpleNamespace(
         workspace_dir="/tmp/ws",
         analysis=SimpleNamespace(
-            first_run_lookback_commits=3, language="en", max_diff_length=100000
+            first_run_lookback_commits=3,
+            language="en",
+            max_diff_length=100000,
+            cache_policy="disabled",
+            requests_per_minute=0,
+            tokens_per_minute=0,
         ),
         github=SimpleNamespace(
             gh_timeout=300, gh_token=None, proxy=None, protocol="https", git_timeout=300
@@ -422,6 +566,9 @@ def test_repository_manager_first_check_uses_recent_commits_when_history_insuffi
     class FakeGitClient:
         workspace_dir = Path("/tmp")
 
+        def close_repo(self, repo_path):
+            pass
+
         def get_current_commit(self, repo_path):
             return "n" * 40
 
@@ -456,7 +603,12 @@ def test_repository_manager_first_check_uses_recent_commits_when_history_insuffi
     cfg = SimpleNamespace(
         workspace_dir="/tmp/ws",
         analysis=SimpleNamespace(
-            first_run_lookback_commits=3, language="en", max_diff_length=100000
+            first_run_lookback_commits=3,
+            language="en",
+            max_diff_length=100000,
+            cache_policy="disabled",
+            requests_per_minute=0,
+            tokens_per_minute=0,
         ),
         github=SimpleNamespace(
             gh_timeout=300, gh_token=None, proxy=None, protocol="https", git_timeout=300
@@ -404,3 +404,46 @@ class TestGetReadme:
 
         with pytest.raises(GitException):
             client.get_readme("owner", "repo")
+
+
+class TestRepoCache:
+    """Test GitHubClient reuses fetched repository objects."""
+
+    def test_release_lookups_share_one_repo_fetch(self):
+        """Test listing releases and reading notes fetch the repo once."""
+        mock_release = Mock()
+        mock_release.tag_name = "v1.0.0"
+        mock_release.body = "notes"
+        mock_release.draft = False
+        mock_release.prerelease = False
+        mock_repo = Mock()
+        mock_repo.get_releases.return_value = [mock_release]
+
+        mock_github = Mock()
+        mock_github.get_repo.return_value = mock_repo
+
+        client = GitHubClient(token="test")
+        client.github = mock_github
+
+        client.list_releases("owner", "repo")
+        assert client.get_release_body("owner", "repo", "v1.0.0") == "notes"
+
+        mock_github.get_repo.assert_called_once_with("owner/repo")
+
+    def test_expired_entry_is_refetched(self):
+        """Test a cached repo older than the TTL is fetched again."""
+        mock_github = Mock()
+        mock_github.get_repo.return_value.get_readme.return_value = Mock(
+            decoded_content=b"readme"
+        )
+
+        client = GitHubClient(token="test")
+        client.github = mock_github
+
+        with patch("progress.git.github_client.time.monotonic") as mock_clock:
+            mock_clock.return_value = 1000.0
+            client.get_readme("owner", "repo")
+            mock_clock.return_value = 1000.0 + 301
+            client.get_readme("owner", "repo")
+
+        assert mock_github.get_repo.call_count == 2
@@ -0,0 +1,40 @@
+"""Logging setup tests."""
+
+import logging
+import threading
+
+from progress import log
+
+
+def test_setup_routes_records_through_queue_listener(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    disabled = {
+        name: logger.disabled
+        for name, logger in logging.root.manager.loggerDict.items()
+        if isinstance(logger, logging.Logger)
+    }
+    progress_logger = logging.getLogger("progress")
+    handlers = progress_logger.handlers[:]
+    try:
+        log.setup()
+        assert [type(h) for h in progress_logger.handlers] == [
+            logging.handlers.QueueHandler
+        ]
+
+        worker = threading.Thread(
+            target=lambda: logging.getLogger("progress.test").info("from worker"),
+            name="repo_checker_0",
+        )
+        worker.start()
+        worker.join()
+    finally:
+        listener = log._queue_listener
+        log._stop_queue_listener()
+        for h in [*progress_logger.handlers, *listener.handlers]:
+            h.close()
+        progress_logger.handlers[:] = handlers
+        for name, value in disabled.items():
+            logging.getLogger(name).disabled = value
+
+    content = (tmp_path / "data" / "progress.log").read_text()
+    assert "[repo_checker_0] - from worker" in content
@@ -1,11 +1,18 @@
 """Repo class unit tests"""
 
+import os
+import shutil
+import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
+
+import pytest
 
 from progress.config import Config
-from progress.contrib.repo.repo import Repo
+from progress.consts import LARGE_DIFF_FILE_MAX_LINES
+from progress.contrib.repo.repo import Repo, _resolve_executable
 from progress.db.models import Repository
+from progress.errors import CommandException
 from progress.git import GitClient
 
 
@@ -86,10 +93,109 @@ class TestRepo:
         result = repo.clone_or_update()
 
         git.fetch_and_reset.assert_called_once_with(
-            Path("/tmp/workspace/owner_repo"), "main"
+            Path("/tmp/workspace/owner_repo"), "main", working_tree=False
         )
         assert result == Path("/tmp/workspace/owner_repo")
 
+    def test_clone_or_update_skips_fetch_when_remote_unchanged(self):
+        """Test clone_or_update does not fetch when remote tip equals HEAD"""
+        model = Mock(spec=Repository)
+        model.url = "https://github.com/owner/repo.git"
+        model.branch = "main"
+        model.last_commit_hash = "abc123"
+
+        git = Mock(spec=GitClient)
+        git.workspace_dir = Path("/tmp/workspace")
+        git.get_remote_head = Mock(return_value="def456")
+        git.get_current_commit = Mock(return_value="def456")
+
+        config = Mock(spec=Config)
+
+        repo = Repo(model, git, config)
+        repo.clone_or_update()
+
+        git.get_remote_head.assert_called_once_with(
+            Path("/tmp/workspace/owner_repo"), "main"
+        )
+        git.fetch_and_reset.assert_not_called()
+
+    def test_clone_or_update_fetches_when_remote_head_lookup_fails(self):
+        """Test a failed ls-remote falls back to a normal fetch"""
+        model = Mock(spec=Repository)
+        model.url = "https://github.com/owner/repo.git"
+        model.branch = "main"
+        model.last_commit_hash = "abc123"
+
+        git = Mock(spec=GitClient)
+        git.workspace_dir = Path("/tmp/workspace")
+        git.get_remote_head = Mock(side_effect=CommandException("ls-remote failed"))
+
+        config = Mock(spec=Config)
+
+        repo = Repo(model, git, config)
+        repo.clone_or_update()
+
+        git.fetch_and_reset.assert_called_once()
+
+    def test_get_diff_reuses_earlier_sync(self):
+        """Test get_diff does not contact the remote again after clone_or_update"""
+        model = Mock(spec=Repository)
+        model.url = "https://github.com/owner/repo.git"
+        model.branch = "main"
+        model.last_commit_hash = "abc123"
+
+        git = Mock(spec=GitClient)
+        git.workspace_dir = Path("/tmp/workspace")
+        git.get_remote_head = Mock(return_value="def456")
+        git.get_current_commit = Mock(return_value="abc123")
+
+        config = Mock(spec=Config)
+
+        repo = Repo(model, git, config)
+        repo.clone_or_update()
+
+        assert repo.get_diff() is None
+        git.get_remote_head.assert_called_once()
+        git.fetch_and_reset.assert_called_once()
+
+    def test_clone_or_update_existing_ssh_multiplexes(self, monkeypatch):
+        """Test SSH fetches share a multiplexed SSH connection"""
+        monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+        model = Mock(spec=Repository)
+        model.url = "git@github.com:owner/repo.git"
+        model.branch = "main"
+        model.last_commit_hash = "abc123"
+
+        git = Mock(spec=GitClient)
+        git.workspace_dir = Path("/tmp/workspace")
+
+        config = Mock(spec=Config)
+
+        repo = Repo(model, git, config)
+        repo.clone_or_update()
+
+        env = git.fetch_and_reset.call_args.kwargs["env"]
+        assert "-o ControlMaster=auto" in env["GIT_SSH_COMMAND"]
+        assert "-o ControlPersist=" in env["GIT_SSH_COMMAND"]
+
+    def test_prepare_env_is_built_once_for_gh(self):
+        """Test gh environment is cached while git commands get none"""
+        model = Mock(spec=Repository)
+        model.url = "https://github.com/owner/repo.git"
+
+        git = Mock(spec=GitClient)
+        git.workspace_dir = Path("/tmp/workspace")
+
+        config = Mock(spec=Config)
+
+        repo = Repo(model, git, config, gh_token="test_token", proxy="http://p:1")
+        env = repo._prepare_env(["gh", "repo", "clone"])
+
+        assert env["GH_TOKEN"] == "test_token"
+        assert env["HTTPS_PROXY"] == "http://p:1"
+        assert repo._prepare_env(["gh", "api"]) is env
+        assert repo._prepare_env(["git", "status"]) is None
+
     def test_get_current_commit(self):
         """Test get_current_commit"""
         model = Mock(spec=Repository)
@@ -177,6 +283,7 @@ class TestRepo:
         git.get_nth_commit_from_head = Mock(return_value="def456")
         git.get_commit_messages = Mock(return_value=["msg1", "msg2"])
         git.get_commit_count = Mock(return_value=2)
+        git.get_diff_shortstat = Mock(return_value=(1, 2, 1))
         git.get_commit_diff = Mock(return_value="diff content")
         git.fetch_and_reset = Mock()
 
@@ -244,6 +351,7 @@ class TestRepo:
         git.get_current_commit = Mock(return_value="def456")
         git.get_commit_messages = Mock(return_value=["msg1"])
         git.get_commit_count = Mock(return_value=1)
+        git.get_diff_shortstat = Mock(return_value=(1, 2, 1))
         git.get_commit_diff = Mock(return_value="diff content")
         git.fetch_and_reset = Mock()
 
@@ -258,11 +366,38 @@ class TestRepo:
         assert previous_commit == "abc123"
         assert commit_count == 1
         assert commit_messages == ["msg1"]
+        git.get_commit_count.assert_not_called()
         assert is_range_check is True
 
+    def test_get_diff_caps_large_diffs_per_file(self):
+        """Test a diff past the line threshold is assembled with capped files"""
+        model = Mock(spec=Repository)
+        model.url = "https://github.com/owner/repo.git"
+        model.branch = "main"
+        model.last_commit_hash = "abc123"
+
+        git = Mock(spec=GitClient)
+        git.workspace_dir = Path("/tmp/workspace")
+        git.get_current_commit = Mock(return_value="def456")
+        git.get_commit_messages = Mock(return_value=["msg1"])
+        git.get_diff_shortstat = Mock(return_value=(40, 9000, 1000))
+        git.get_capped_commit_diff = Mock(return_value="capped diff")
+        git.fetch_and_reset = Mock()
+
+        repo = Repo(model, git, Mock(spec=Config))
+        with patch.object(repo, "clone_or_update"):
+            diff, *_ = repo.get_diff()
+
+        assert diff == "capped diff"
+        git.get_commit_diff.assert_not_called()
+        git.get_capped_commit_diff.assert_called_once_with(
+            repo.repo_path, "abc123", "def456", LARGE_DIFF_FILE_MAX_LINES
+        )
+
     def test_update(self):
-        """Test update saves model changes"""
+        """Test update writes the commit with a single UPDATE"""
         model = Mock(spec=Repository)
+        model.id = 7
         model.url = "https://github.com/owner/repo.git"
         model.last_commit_hash = "abc123"
 
@@ -273,14 +408,15 @@ class TestRepo:
 
         repo = Repo(model, git, config)
 
-        with patch("progress.db.database") as mock_db_module:
-            mock_database = MagicMock()
-            mock_db_module.database = mock_database
-
+        with patch("progress.contrib.repo.repo.Repository") as mock_repository:
             repo.update("def456")
 
+            fields = mock_repository.update.call_args.kwargs
+            assert fields["last_commit_hash"] == "def456"
+            assert fields["last_check_time"] is not None
+            mock_repository.update.return_value.where.return_value.execute.assert_called_once()
             assert model.last_commit_hash == "def456"
-            model.save.assert_called_once()
+            model.save.assert_not_called()
 
     def test_get_commit_messages(self):
         """Test get_commit_messages"""
@@ -325,3 +461,54 @@ class TestRepo:
             call_args = mock_run.call_args[0][0]
             assert "--" in call_args
             assert "--tags" in call_args
+
+    def test_clone_uses_blobless_filter(self):
+        """Test that clone command requests a blobless partial clone"""
+        model = Mock(spec=Repository)
+        model.url = "https://github.com/owner/repo.git"
+        model.branch = "main"
+        model.last_commit_hash = None
+
+        git = Mock(spec=GitClient)
+        git.workspace_dir = Path("/tmp/workspace")
+
+        config = Mock(spec=Config)
+        github_config = Mock()
+        github_config.gh_timeout = 300
+        config.github = github_config
+
+        repo = Repo(model, git, config, gh_token="test_token")
+
+        with patch.object(repo, "_run_command") as mock_run:
+            repo._run_gh_clone_command("https://github.com/owner/repo.git", "main")
+
+            call_args = mock_run.call_args[0][0]
+            assert "--filter=blob:none" in call_args[call_args.index("--") :]
+            assert "--no-checkout" in call_args[call_args.index("--") :]
+
+    @pytest.mark.skipif(
+        not subprocess._USE_POSIX_SPAWN, reason="posix_spawn not used on this platform"
+    )
+    def test_run_command_spawns_with_posix_spawn(self, monkeypatch):
+        """Test gh commands resolve to an absolute path and use posix_spawn"""
+        model = Mock(spec=Repository)
+        model.url = "https://github.com/owner/repo.git"
+        git = Mock(spec=GitClient)
+        git.workspace_dir = Path("/tmp/workspace")
+        config = Mock(spec=Config)
+        config.github = Mock(gh_timeout=30)
+        repo = Repo(model, git, config)
+
+        executable = shutil.which("true")
+        monkeypatch.setattr(
+            "progress.contrib.repo.repo.shutil.which", lambda name: executable
+        )
+        _resolve_executable.cache_clear()
+        spawn = Mock(wraps=os.posix_spawn)
+        monkeypatch.setattr(os, "posix_spawn", spawn)
+        try:
+            repo._run_command(["true"])
+        finally:
+            _resolve_executable.cache_clear()
+
+        assert spawn.call_args[0][0] == executable
@@ -24,6 +24,8 @@ def mock_config():
     config.github.proxy = None
     config.analysis.language = "en"
     config.analysis.max_diff_length = 100000
+    config.analysis.requests_per_minute = 0
+    config.analysis.tokens_per_minute = 0
     return config
 
 
@@ -247,25 +249,26 @@ class TestUpdateReleases:
     def test_updates_repository_fields(
         self, mock_repository, mock_git_client, mock_config
     ):
-        """Test that update_releases sets the correct fields."""
-        from progress import db
-
+        """Test that update_releases writes the fields with a single UPDATE."""
+        mock_repository.id = 3
         repo = Repo(mock_repository, mock_git_client, mock_config)
 
-        # Mock the database and atomic transaction
         with patch("progress.contrib.repo.repo.get_now") as mock_get_now:
-            with patch.object(db, "database") as mock_database:
+            with patch("progress.contrib.repo.repo.Repository") as mock_model:
                 mock_get_now.return_value = datetime(
                     2024, 2, 1, 0, 0, 0, tzinfo=ZoneInfo("UTC")
                 )
-                mock_database.atomic.return_value.__enter__ = Mock()
-                mock_database.atomic.return_value.__exit__ = Mock(return_value=False)
 
                 repo.update_releases("v2.0.0", "abc123")
 
+                fields = mock_model.update.call_args.kwargs
+                assert fields["last_release_tag"] == "v2.0.0"
+                assert fields["last_release_commit_hash"] == "abc123"
+                mock_model.update.return_value.where.return_value.execute.assert_called_once()
                 assert repo.model.last_release_tag == "v2.0.0"
                 assert repo.model.last_release_commit_hash == "abc123"
                 assert repo.model.last_release_check_time is not None
+                mock_repository.save.assert_not_called()
 
 
 class TestReleaseAnalysisFallback:
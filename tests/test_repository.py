@@ -1,11 +1,11 @@
 """RepositoryManager unit tests"""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from progress.contrib.repo.reporter import MarkdownReporter
-from progress.contrib.repo.repository import RepositoryManager
+from progress.contrib.repo.repository import RepositoryManager, _freeze_messages
 
 
 class TestRepositoryManager:
@@ -18,6 +18,8 @@ class TestRepositoryManager:
         config.workspace_dir = "/tmp/workspace"
         config.analysis.language = "en"
         config.analysis.max_diff_length = 100000
+        config.analysis.requests_per_minute = 0
+        config.analysis.tokens_per_minute = 0
         github_config = Mock()
         github_config.gh_token = "test_token"
         github_config.proxy = None
@@ -274,3 +276,251 @@ class TestRepositoryManager:
 
             assert result == []
             mock_analyze.assert_not_called()
+
+    def test_check_all_concurrent_collects_reports_and_statuses(self, repo_manager):
+        """Test concurrent check_all runs each repo on its own connection"""
+        repos = [Mock(name=f"repo{i}") for i in range(3)]
+        for i, repo in enumerate(repos):
+            repo.name = f"repo{i}"
+
+        def fake_check(repo):
+            if repo.name == "repo0":
+                return None
+            if repo.name == "repo1":
+                raise RuntimeError("boom")
+            return Mock(commit_count=4)
+
+        database = MagicMock()
+        database.is_closed.return_value = True
+        with (
+            patch(
+                "progress.db.database",
+                database,
+            ),
+            patch.object(repo_manager, "check", side_effect=fake_check),
+        ):
+            result = repo_manager.check_all(repos, concurrency=8)
+
+        # One for the calling thread, one per repository task.
+        assert database.connection_context.call_count == 4
+        assert len(result.reports) == 1
+        assert result.total_commits == 4
+        assert result.repo_statuses == {
+            "repo0": "skipped",
+            "repo1": "failed",
+            "repo2": "success",
+        }
+
+    def test_check_all_writes_commits_in_one_transaction(self, repo_manager, tmp_path):
+        """Test check_all defers analysed commits and flushes them together"""
+        from progress.db import close_db, create_tables, init_db
+        from progress.db.models import Repository
+
+        init_db(str(tmp_path / "test.db"))
+        create_tables()
+        try:
+            repos = [
+                Repository.create(
+                    name=f"owner/repo{i}",
+                    url=f"https://github.com/owner/repo{i}.git",
+                    branch="main",
+                )
+                for i in range(2)
+            ]
+
+            def fake_check(repo):
+                repo_obj = Mock(model=repo)
+                repo_manager._record_commit(repo_obj, f"commit-{repo.name}")
+                repo_obj.update.assert_not_called()
+                assert Repository.get_by_id(repo.id).last_commit_hash is None
+                return Mock(commit_count=1)
+
+            with patch.object(repo_manager, "check", side_effect=fake_check):
+                repo_manager.check_all(repos)
+
+            assert repo_manager._pending_commits is None
+            assert sorted(r.last_commit_hash for r in Repository.select()) == [
+                "commit-owner/repo0",
+                "commit-owner/repo1",
+            ]
+        finally:
+            close_db()
+
+    def test_check_computes_diff_while_releases_are_fetched(self, repo_manager):
+        """Test get_diff runs on a helper thread alongside check_releases"""
+        import threading
+
+        repo = Mock()
+        repo.name = "owner/repo"
+        repo.branch = "main"
+        diff_started = threading.Event()
+        threads = {}
+
+        def check_releases():
+            # Only returns once get_diff has started on the other thread.
+            assert diff_started.wait(timeout=5)
+            threads["releases"] = threading.current_thread().name
+
+        def get_diff():
+            diff_started.set()
+            threads["diff"] = threading.current_thread().name
+
+        repo_obj = Mock()
+        repo_obj.check_releases.side_effect = check_releases
+        repo_obj.get_diff.side_effect = get_diff
+
+        assert repo_manager._check_repo(repo, repo_obj) is None
+        assert threads["diff"].startswith("repo_diff")
+        assert threads["releases"] != threads["diff"]
+
+    def test_check_computes_diff_in_the_callers_context(self, repo_manager):
+        """Test get_diff sees the OpenTelemetry context of the checking thread"""
+        from opentelemetry import context as otel_context
+
+        repo = Mock()
+        repo.name = "owner/repo"
+        repo.branch = "main"
+        seen = {}
+
+        def get_diff():
+            seen["value"] = otel_context.get_value("check")
+
+        repo_obj = Mock()
+        repo_obj.check_releases.return_value = None
+        repo_obj.get_diff.side_effect = get_diff
+
+        token = otel_context.attach(otel_context.set_value("check", "owner/repo"))
+        try:
+            repo_manager._check_repo(repo, repo_obj)
+        finally:
+            otel_context.detach(token)
+
+        assert seen["value"] == "owner/repo"
+
+    def test_check_records_releases_before_raising_diff_error(self, repo_manager):
+        """Test a failed diff still lets release state be recorded first"""
+        repo = Mock()
+        repo.name = "owner/repo"
+        repo.branch = "main"
+        repo.last_release_commit_hash = None
+
+        repo_obj = Mock()
+        repo_obj.check_releases.return_value = {
+            "releases": [
+                {
+                    "tag_name": "v1.0.0",
+                    "title": "v1.0.0",
+                    "notes": "",
+                    "published_at": "2024-01-01T00:00:00Z",
+                    "commit_hash": "abc123",
+                }
+            ],
+            "is_first_check": True,
+        }
+        repo_obj.get_diff.side_effect = RuntimeError("git failed")
+
+        with (
+            patch(
+                "progress.contrib.repo.repository.analyze_releases",
+                return_value=("summary", "detail"),
+            ),
+            pytest.raises(RuntimeError, match="git failed"),
+        ):
+            repo_manager._check_repo(repo, repo_obj)
+
+        repo_obj.update_releases.assert_called_once_with("v1.0.0", "abc123")
+
+    def test_list_enabled_loads_check_columns_only(self, repo_manager, tmp_path):
+        """Test list_enabled returns enabled repos without bookkeeping columns"""
+        from progress.db import close_db, create_tables, init_db
+        from progress.db.models import Repository
+
+        init_db(str(tmp_path / "test.db"))
+        create_tables()
+        try:
+            Repository.create(
+                name="owner/on",
+                url="https://github.com/owner/on.git",
+                branch="main",
+                last_commit_hash="abc",
+            )
+            Repository.create(
+                name="owner/off",
+                url="https://github.com/owner/off.git",
+                branch="main",
+                enabled=False,
+            )
+
+            (repo,) = repo_manager.list_enabled()
+        finally:
+            close_db()
+
+        assert repo.name == "owner/on"
+        assert repo.last_commit_hash == "abc"
+        assert "created_at" not in repo.__data__
+
+    def test_list_enabled_keeps_callers_connection_open(self, repo_manager, tmp_path):
+        """Test list_enabled reuses an open connection instead of closing it"""
+        from progress import db
+        from progress.db import close_db, create_tables, init_db
+
+        init_db(str(tmp_path / "test.db"))
+        create_tables()
+        try:
+            with db.database.connection_context():
+                repo_manager.list_enabled()
+                assert not db.database.is_closed()
+        finally:
+            close_db()
+
+    def test_check_all_caps_analyses_below_io_workers(self, repo_manager):
+        """Test io_concurrency widens the pool while analyses stay capped"""
+        import threading
+        import time
+
+        repos = [Mock() for _ in range(6)]
+        for i, repo in enumerate(repos):
+            repo.name = f"repo{i}"
+        lock = threading.Lock()
+        running = {"checks": 0, "analyses": 0}
+        peak = {"checks": 0, "analyses": 0}
+
+        def enter(kind):
+            with lock:
+                running[kind] += 1
+                peak[kind] = max(peak[kind], running[kind])
+
+        def leave(kind):
+            with lock:
+                running[kind] -= 1
+
+        def fake_check(repo):
+            enter("checks")
+            time.sleep(0.05)
+            with repo_manager._analysis_slots:
+                enter("analyses")
+                time.sleep(0.02)
+                leave("analyses")
+            leave("checks")
+
+        with (
+            patch("progress.db.database", MagicMock()),
+            patch.object(repo_manager, "check", side_effect=fake_check),
+        ):
+            repo_manager.check_all(repos, concurrency=1, io_concurrency=3)
+
+        assert peak["checks"] == 3
+        assert peak["analyses"] == 1
+
+
+def test_freeze_messages_interns_short_messages():
+    """Test report commit messages become a tuple sharing short strings"""
+    long_message = "x" * 1000
+
+    # Concatenated at runtime so each call gets its own string object.
+    word = "version"
+    first = _freeze_messages(["Bump " + word, long_message])
+    second = _freeze_messages(["Bump " + word])
+
+    assert first == ("Bump version", long_message)
+    assert first[0] is second[0]
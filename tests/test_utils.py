@@ -1,11 +1,12 @@
 """Tests for utils module"""
 
+import sys
 import time
 from unittest.mock import Mock, patch
 
 import pytest
 
-from progress.utils import retry, sanitize
+from progress.utils import TokenBucket, retry, run_command, sanitize, utf8_size
 
 
 class TestSanitize:
@@ -189,6 +190,110 @@ class TestRetry:
             func()
 
 
+class TestRunCommand:
+    """Tests for run_command"""
+
+    def test_returns_decoded_stdout(self):
+        """Test stdout is decoded as UTF-8 with newlines normalized"""
+        out = run_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stdout.buffer.write(b'caf\\xc3\\xa9\\r\\nok')",
+            ]
+        )
+        assert out == "café\nok"
+
+    def test_invalid_utf8_is_replaced(self):
+        """Test undecodable output does not raise"""
+        out = run_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stdout.buffer.write(b'bad \\xff byte')",
+            ]
+        )
+        assert out == "bad \ufffd byte"
+
+    def test_input_is_passed_to_stdin(self):
+        """Test the input string reaches the command"""
+        out = run_command(
+            [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+            input="héllo",
+        )
+        assert out == "HÉLLO\n"
+
+    def test_failure_raises_command_exception(self):
+        """Test non-zero exit raises CommandException with stderr"""
+        from progress.errors import CommandException
+
+        with pytest.raises(CommandException, match="boom"):
+            run_command(
+                [
+                    sys.executable,
+                    "-c",
+                    "import sys; sys.stderr.write('boom'); sys.exit(1)",
+                ]
+            )
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket rate limiter"""
+
+    @staticmethod
+    def _bucket(requests_per_minute=0, tokens_per_minute=0):
+        clock = {"now": 0.0}
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock["now"] += seconds
+
+        bucket = TokenBucket(
+            requests_per_minute,
+            tokens_per_minute,
+            clock=lambda: clock["now"],
+            sleep=sleep,
+        )
+        return bucket, sleeps
+
+    def test_burst_up_to_limit_does_not_wait(self):
+        """Test a full bucket serves a minute's worth of requests at once"""
+        bucket, sleeps = self._bucket(requests_per_minute=3)
+        for _ in range(3):
+            bucket.acquire()
+        assert sleeps == []
+
+    def test_waits_for_request_refill(self):
+        """Test an empty request budget waits one refill interval"""
+        bucket, sleeps = self._bucket(requests_per_minute=60)
+        for _ in range(60):
+            bucket.acquire()
+        bucket.acquire()
+        assert sleeps == [pytest.approx(1.0)]
+
+    def test_waits_for_token_budget(self):
+        """Test a request larger than the remaining tokens waits for them"""
+        bucket, sleeps = self._bucket(tokens_per_minute=600)
+        bucket.acquire(tokens=600)
+        bucket.acquire(tokens=300)
+        assert sleeps == [pytest.approx(30.0)]
+
+    def test_oversized_request_is_capped_at_limit(self):
+        """Test a request above the per-minute limit waits for a full bucket"""
+        bucket, sleeps = self._bucket(tokens_per_minute=100)
+        bucket.acquire(tokens=1000)
+        bucket.acquire(tokens=1000)
+        assert sleeps == [pytest.approx(60.0)]
+
+    def test_disabled_limits_never_wait(self):
+        """Test zero limits disable the bucket"""
+        bucket, sleeps = self._bucket()
+        for _ in range(100):
+            bucket.acquire(tokens=10**6)
+        assert sleeps == []
+
+
 class TestStripGitSuffix:
     """Test strip_git_suffix function."""
 
@@ -236,6 +341,17 @@ def _report(name, content):
     return obj
 
 
+class TestUtf8Size:
+    """Tests for utf8_size"""
+
+    @pytest.mark.parametrize(
+        "text", ["", "plain ascii\n", "héllo", "日本語", "emoji 🎉"]
+    )
+    def test_matches_encoded_length(self, text):
+        """Test the size equals the UTF-8 encoded length"""
+        assert utf8_size(text) == len(text.encode("utf-8"))
+
+
 class TestCreateReportBatches:
     """Tests for create_report_batches size-based splitting."""
 